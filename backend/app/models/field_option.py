@@ -14,6 +14,11 @@ class FieldOption(db.Model):
             '(tracker_field_id IS NOT NULL) OR (tracker_user_field_id IS NOT NULL)',
             name='check_field_reference'
         ),
+        # Cover the ordered sibling lookups used by option ordering
+        db.Index('idx_field_options_user_field_order',
+                 'tracker_user_field_id', 'is_active', 'option_order'),
+        db.Index('idx_field_options_field_order',
+                 'tracker_field_id', 'is_active', 'option_order'),
     )
     
     # Option identification
@@ -8,6 +8,7 @@ class Tracker(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     category_id = db.Column(db.Integer, db.ForeignKey('tracker_categories.id'), nullable=False)
     data = db.relationship('TrackingData', backref='tracker', lazy=True, passive_deletes=True)
+    category = db.relationship('TrackerCategory', lazy=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_default = db.Column(db.Boolean, default=False)
     # Tracker model
@@ -29,6 +29,13 @@ class TrackerField(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
     
+    # Indexes
+    __table_args__ = (
+        # Covers the ordered sibling lookups used by field ordering
+        db.Index('idx_tracker_fields_category_group_order',
+                 'category_id', 'field_group', 'is_active', 'field_order'),
+    )
+    
     # Relationships
     category = db.relationship('TrackerCategory', backref='fields')
     
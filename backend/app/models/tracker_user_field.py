@@ -28,6 +28,13 @@ class TrackerUserField(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
     
+    # Indexes
+    __table_args__ = (
+        # Covers the ordered sibling lookups used by field ordering
+        db.Index('idx_tracker_user_fields_tracker_order',
+                 'tracker_id', 'is_active', 'field_order'),
+    )
+    
     # Relationships
     tracker = db.relationship('Tracker', backref='user_fields')
     
@@ -1415,8 +1415,9 @@ def get_pattern_chart(tracker_id: int):
     - chart_type: Chart visualization type (default: "heatmap")
     - months: Number of months to analyze (default: 3)
     - option: Optional specific option for nested fields
+    - image_format: "png" (default), "webp" or "jpeg"
     
-    Returns: PNG image
+    Returns: Image in the requested format
     
     Examples:
     - GET /api/data-tracking/1/pattern-chart?field_name=mood.overall
@@ -1433,6 +1434,16 @@ def get_pattern_chart(tracker_id: int):
         chart_type = request.args.get('chart_type', 'heatmap')
         months = request.args.get('months', type=int, default=3)
         option = request.args.get('option')
+        image_format = request.args.get('image_format', 'png')
+        
+        from app.services.pattern_chart_service import PatternChartService
+        
+        # Reject unknown formats before paying for the query and detection
+        if image_format not in PatternChartService.IMAGE_FORMATS:
+            return error_response(
+                f"Invalid image_format. Must be one of: {', '.join(PatternChartService.IMAGE_FORMATS)}",
+                400
+            )
         
         # Get pattern data
         pattern_data = PatternRecognitionService.detect_all_patterns(
@@ -1444,13 +1455,13 @@ def get_pattern_chart(tracker_id: int):
         )
         
         # Generate chart
-        from app.services.pattern_chart_service import PatternChartService
         image_data = PatternChartService.generate_pattern_chart(
             pattern_data,
             tracker_id,
             field_name,
             chart_type=chart_type,
-            months=months
+            months=months,
+            image_format=image_format
         )
         
         # Build filename
@@ -1458,11 +1469,11 @@ def get_pattern_chart(tracker_id: int):
         if option:
             filename += f'_{option}'
         filename += f'_{chart_type}_'
-        filename += f'{months}months.png'
+        filename += f'{months}months.{image_format}'
         
         return Response(
             image_data,
-            mimetype='image/png',
+            mimetype=PatternChartService.IMAGE_FORMATS[image_format],
             headers={
                 'Content-Disposition': f'inline; filename={filename}'
             }
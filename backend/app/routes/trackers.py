@@ -1469,9 +1469,10 @@ def update_field_order(tracker_field_id: int):
             return error_response("new_order is required", 400)
         
         # User-created fields are safe to mutate directly.
+        changed_orders = None
         if isinstance(field, TrackerUserField):
             # Update field order (this commits internally)
-            CategoryService.update_field_order(tracker_field_id, new_order)
+            changed_orders = CategoryService.update_field_order(tracker_field_id, new_order)
         else:
             tracker = get_owned_tracker_for_category(field.category_id, user_id)
             upsert_field_override(
@@ -1498,7 +1499,15 @@ def update_field_order(tracker_field_id: int):
                 db.session.expire(category)
                 CategoryService.rebuild_category_schema(category, None)
         
-        return success_response("Field order updated successfully")
+        return success_response(
+            "Field order updated successfully",
+            {
+                'updated_field_orders': [
+                    {'id': changed_id, 'field_order': order}
+                    for changed_id, order in changed_orders.items()
+                ]
+            } if changed_orders else None
+        )
     except ValueError as ve:
         return error_response(str(ve), 400)
     except Exception as e:
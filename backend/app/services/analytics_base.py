@@ -341,6 +341,8 @@ class AnalyticsDataExtractor:
                 'entry_date': date,
                 'entry_id': id
             }
+            in the same order as entries (callers that need date order, such
+            as pattern detection, query entries ordered by entry_date)
         """
         # Detect field type
         field_type = 'numeric'  # Default
@@ -896,10 +896,11 @@ class CategoryService:
     # ========================================================================
     
     @staticmethod
-    def update_field_order(field_id: int, new_order: int) -> None:
+    def update_field_order(field_id: int, new_order: int) -> Dict[int, int]:
         """
         Update field order - delegates to FieldOrderingService.
         Automatically detects if field is TrackerField or TrackerUserField.
+        Returns the new field_order of every sibling that changed, keyed by ID.
         """
         # Lazy import to avoid circular dependency
         from app.services.field_ordering_service import FieldOrderingService
@@ -907,11 +908,10 @@ class CategoryService:
         # Try user field first
         user_field = TrackerUserField.query.filter_by(id=field_id).first()
         if user_field:
-            FieldOrderingService.update_user_field_order(field_id, new_order)
-            return
+            return FieldOrderingService.update_user_field_order(field_id, new_order)
         
         # Try category field
-        FieldOrderingService.update_tracker_field_order(field_id, new_order)
+        return FieldOrderingService.update_tracker_field_order(field_id, new_order)
     
     @staticmethod
     def normalize_all_field_orders(category_id: int, tracker_id: int = None) -> None:
@@ -1132,15 +1132,14 @@ class CategoryService:
             from app.models.tracker import Tracker
             field_name = field_data['field_name']
             
-            # Get max order for user fields on this tracker
-            max_order = db.session.query(db.func.max(TrackerUserField.field_order)).filter_by(
-                tracker_id=tracker.id
-            ).scalar() or -1
+            from app.services.field_ordering_service import FieldOrderingService
             
             tracker_user_field = TrackerUserField(
                 tracker_id=tracker.id,
                 field_name=field_name,
-                field_order=max_order + 1,
+                field_order=FieldOrderingService.next_user_field_order(
+                    tracker.id, tracker.category_id
+                ),
                 display_label=field_data.get('display_label', field_name),
                 help_text=field_data.get('help_text'),
                 is_active=True
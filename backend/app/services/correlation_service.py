@@ -8,9 +8,11 @@ Supports:
 - Time-lagged correlations (e.g., yesterday's sleep → today's energy)
 """
 
+import heapq
+import sys
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import date, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict
 from itertools import combinations
 import numpy as np
 from scipy import stats
@@ -298,6 +300,8 @@ class CorrelationService:
         
         # Return only top 3 correlations
         top_correlations = correlations[:3]
+        for correlation in top_correlations:
+            CorrelationService._render_insight(correlation)
         
         result = {
             'field_name': field_name,
@@ -410,6 +414,7 @@ class CorrelationService:
                     'correlation_type': 'dual'
                 }
             
+            CorrelationService._render_insight(correlation)
             return {
                 **correlation,
                 'has_correlation': True,
@@ -571,9 +576,7 @@ class CorrelationService:
             'lag_days': int(lag_days),
             'slope': float(round(slope, 3)),
             'relationship': relationship,
-            'insight': CorrelationService._generate_numeric_insight(
-                field1, field2, correlation, slope, lag_days
-            )
+            '_insight_args': (field1, field2, correlation, slope, lag_days)
         }
     
     @staticmethod
@@ -686,7 +689,7 @@ class CorrelationService:
             },
             'difference': float(round(difference, 2)),
             'percent_difference': float(round(percent_diff, 1)),
-            'insight': CorrelationService._generate_categorical_numeric_insight(
+            '_insight_args': (
                 categorical_field, numeric_field, highest_group, lowest_group,
                 difference, percent_diff, lag_days, reverse
             )
@@ -788,19 +791,37 @@ class CorrelationService:
                 'lag_days': int(lag_days),
                 'categories1': [str(c) for c in categories1],
                 'categories2': [str(c) for c in categories2],
-                'strong_associations': sorted(
-                    associations,
-                    key=lambda x: abs(x['residual']),
-                    reverse=True
-                )[:5],
-                'insight': CorrelationService._generate_categorical_insight(
-                    field1, field2, associations, lag_days
-                )
+                'strong_associations': heapq.nlargest(
+                    5, associations, key=lambda x: abs(x['residual'])
+                ),
+                '_insight_args': (field1, field2, associations, lag_days)
             }
         
         except Exception:
             return None
     
+    @staticmethod
+    def _render_insight(correlation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill in the 'insight' text for a pair correlation.
+        
+        The pair analyzers only stash the raw arguments under '_insight_args';
+        the string is built here once a correlation is actually returned, so
+        candidates that get filtered or ranked out never pay for formatting.
+        """
+        args = correlation.pop('_insight_args', None)
+        if args is None:
+            return correlation
+        
+        correlation_type = correlation.get('correlation_type')
+        if correlation_type == 'numeric_numeric':
+            correlation['insight'] = CorrelationService._generate_numeric_insight(*args)
+        elif correlation_type == 'numeric_categorical':
+            correlation['insight'] = CorrelationService._generate_categorical_numeric_insight(*args)
+        else:
+            correlation['insight'] = CorrelationService._generate_categorical_insight(*args)
+        return correlation
+    
     @staticmethod
     def _generate_numeric_insight(
         field1: str,
@@ -966,22 +987,13 @@ class CorrelationService:
             if strength >= 0.99:
                 return False
             
-            # Must have meaningful associations (not just single observations)
-            strong_assoc = correlation.get('strong_associations', [])
-            if not strong_assoc:
-                return False
-            
-            # Check that at least one association has meaningful count (>= 2, not just 1)
-            max_count = max((a.get('count', 0) for a in strong_assoc), default=0)
-            if max_count < 2:
-                return False
-            
             # Skip correlations between fields with very similar names
             field1 = correlation.get('field1', '')
             field2 = correlation.get('field2', '')
             
             # Skip if both fields are from same parent (e.g., sleep.quality vs sleep.hours)
-            # These are expected to correlate and not insightful
+            # These are expected to correlate and not insightful.
+            # Checked before the association scan below since it is a cheap string compare.
             if '.' in field1 and '.' in field2:
                 parent1 = field1.split('.')[0]
                 parent2 = field2.split('.')[0]
@@ -989,6 +1001,16 @@ class CorrelationService:
                     # Allow some within-parent correlations but be selective
                     if strength < 0.6:
                         return False
+            
+            # Must have meaningful associations (not just single observations)
+            strong_assoc = correlation.get('strong_associations', [])
+            if not strong_assoc:
+                return False
+            
+            # Check that at least one association has meaningful count (>= 2, not just 1)
+            max_count = max((a.get('count', 0) for a in strong_assoc), default=0)
+            if max_count < 2:
+                return False
         
         # For numeric correlations, avoid very weak ones
         if correlation.get('correlation_type') == 'numeric_numeric':
@@ -1035,6 +1057,7 @@ class CorrelationService:
         Used when cross-field data is sparse or the tracker mostly logs one field group.
         """
         within_correlations: List[Dict[str, Any]] = []
+        scratch = CorrelationService._allocate_pair_scratch(field_data_by_date)
 
         for parent, child_fields in CorrelationService._group_fields_by_parent(all_fields).items():
             if len(child_fields) < 2:
@@ -1042,7 +1065,8 @@ class CorrelationService:
 
             for field1, field2 in combinations(sorted(child_fields), 2):
                 pattern = CorrelationService._analyze_dual_frequent_pattern(
-                    field_data_by_date, field1, field2, tracker_id, min_correlation
+                    field_data_by_date, field1, field2, tracker_id, min_correlation,
+                    scratch=scratch
                 )
                 if not pattern:
                     continue
@@ -1141,8 +1165,12 @@ class CorrelationService:
         if len(common_dates) < 10:
             return None
         
-        # Group by predictor combinations
-        patterns = defaultdict(list)
+        # Encode predictor combinations and outcomes as integer codes in
+        # first-seen order, so ties resolve to the earliest observation
+        pair_index: Dict[Tuple[str, str], int] = {}
+        outcome_index: Dict[str, int] = {}
+        pair_codes = []
+        outcome_codes = []
         
         for date_key in common_dates:
             pred1_val = CorrelationService._categorize_value(pred1_data[date_key], predictor1)
@@ -1150,30 +1178,30 @@ class CorrelationService:
             outcome_val = CorrelationService._categorize_value(outcome_data[date_key], outcome)
             
             if pred1_val and pred2_val and outcome_val:
-                key = (pred1_val, pred2_val)
-                patterns[key].append(outcome_val)
+                pair_codes.append(pair_index.setdefault((pred1_val, pred2_val), len(pair_index)))
+                outcome_codes.append(outcome_index.setdefault(outcome_val, len(outcome_index)))
+        
+        if not pair_codes:
+            return None
+        
+        pair_codes = np.array(pair_codes, dtype=np.int64)
+        outcome_codes = np.array(outcome_codes, dtype=np.int64)
         
         # Find most frequent pattern (highest observation count)
-        best_pattern = None
-        best_count = 0
-        best_outcome = None
-        
-        for (pred1_val, pred2_val), outcome_vals in patterns.items():
-            if len(outcome_vals) >= CorrelationService.MIN_OBSERVATIONS:
-                most_common_outcome = Counter(outcome_vals).most_common(1)[0]
-                outcome_val, count_in_pattern = most_common_outcome
-                
-                # Total observations of this pattern
-                total_count = len(outcome_vals)
-                
-                if total_count > best_count:
-                    best_count = total_count
-                    best_pattern = (pred1_val, pred2_val)
-                    best_outcome = outcome_val
+        pattern_counts = np.bincount(pair_codes)
+        best_code = int(np.argmax(pattern_counts))
+        best_count = int(pattern_counts[best_code])
         
-        if not best_pattern or best_count < CorrelationService.MIN_OBSERVATIONS:
+        if best_count < CorrelationService.MIN_OBSERVATIONS:
             return None
         
+        # Most common outcome, only for the winning pattern
+        best_outcome_code = CorrelationService._most_common_code(
+            outcome_codes[pair_codes == best_code]
+        )
+        best_pattern = list(pair_index)[best_code]
+        best_outcome = list(outcome_index)[best_outcome_code]
+        
         return {
             'type': 'triple',
             'predictor1': predictor1,
@@ -1187,6 +1215,13 @@ class CorrelationService:
             'insight': f"When {predictor1} is '{best_pattern[0]}' AND {predictor2} is '{best_pattern[1]}', {outcome} is typically '{best_outcome}' ({best_count} times)"
         }
     
+    @staticmethod
+    def _most_common_code(codes: np.ndarray) -> int:
+        """Most frequent integer code; ties go to the code seen first (like Counter)."""
+        values, first_seen, counts = np.unique(codes, return_index=True, return_counts=True)
+        tied = counts == counts.max()
+        return int(values[tied][np.argmin(first_seen[tied])])
+    
     @staticmethod
     def _find_dual_correlations(
         field_data_by_date: Dict,
@@ -1196,6 +1231,7 @@ class CorrelationService:
     ) -> List[Dict[str, Any]]:
         """Find dual correlations ranked by observation frequency."""
         dual_correlations = []
+        scratch = CorrelationService._allocate_pair_scratch(field_data_by_date)
         
         # Analyze pairs
         for field1, field2 in combinations(all_fields[:15], 2):
@@ -1205,7 +1241,8 @@ class CorrelationService:
                     continue
             
             pattern = CorrelationService._analyze_dual_frequent_pattern(
-                field_data_by_date, field1, field2, tracker_id, min_correlation
+                field_data_by_date, field1, field2, tracker_id, min_correlation,
+                scratch=scratch
             )
             
             if pattern:
@@ -1213,15 +1250,32 @@ class CorrelationService:
         
         return dual_correlations
     
+    @staticmethod
+    def _allocate_pair_scratch(field_data_by_date: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Allocate paired float buffers large enough for any field pair.
+        
+        Shared across the pair loop so numeric pairs are filled in place
+        instead of building fresh value lists per pair.
+        """
+        size = max((len(data) for data in field_data_by_date.values()), default=0)
+        return np.empty(size, dtype=np.float64), np.empty(size, dtype=np.float64)
+    
     @staticmethod
     def _analyze_dual_frequent_pattern(
         field_data_by_date: Dict,
         field1: str,
         field2: str,
         tracker_id: int,
-        min_correlation: float
+        min_correlation: float,
+        scratch: Optional[Tuple[np.ndarray, np.ndarray]] = None
     ) -> Optional[Dict[str, Any]]:
-        """Analyze dual pattern focusing on most frequent observations."""
+        """
+        Analyze dual pattern focusing on most frequent observations.
+        
+        scratch: optional (x, y) buffers from _allocate_pair_scratch, reused
+            for numeric pairs; allocated here when not provided.
+        """
         field1_data = field_data_by_date.get(field1, {})
         field2_data = field_data_by_date.get(field2, {})
         
@@ -1244,8 +1298,22 @@ class CorrelationService:
         
         # Both numeric - use correlation coefficient
         if type1 == 'numeric' and type2 == 'numeric':
-            values1 = [float(field1_data[d]) for d in common_dates if isinstance(field1_data[d], (int, float))]
-            values2 = [float(field2_data[d]) for d in common_dates if isinstance(field2_data[d], (int, float))]
+            if scratch is None or len(scratch[0]) < len(common_dates):
+                scratch = (np.empty(len(common_dates)), np.empty(len(common_dates)))
+            buf1, buf2 = scratch
+            
+            n = 0
+            for d in common_dates:
+                v1 = field1_data[d]
+                v2 = field2_data[d]
+                if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
+                    buf1[n] = v1
+                    buf2[n] = v2
+                    n += 1
+            
+            # Views into the shared buffers; only valid until the next pair
+            values1 = buf1[:n]
+            values2 = buf2[:n]
             
             if len(values1) < 10:
                 return None
@@ -1349,7 +1417,7 @@ class CorrelationService:
             )
             
             if extracted:
-                field_data[field] = {
+                field_data[sys.intern(field)] = {
                     item['entry_date']: item['value']
                     for item in extracted
                     if item['value'] is not None
@@ -1413,7 +1481,9 @@ class CorrelationService:
                 if isinstance(value, dict) and value:
                     flatten_fields(value, field_path)
                 elif value is not None:
-                    fields.add(field_path)
+                    # Interned so the many dict/set lookups on field paths
+                    # downstream hit the identity fast path
+                    fields.add(sys.intern(field_path))
         
         for entry in entries:
             if entry.data:
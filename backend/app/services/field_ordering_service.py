@@ -1,5 +1,6 @@
-from typing import List, Union
-from sqlalchemy.orm.attributes import flag_modified
+from typing import Dict, List, Optional, Tuple, Union
+from flask import g
+from sqlalchemy import and_, case, func, or_, select, update
 
 from app import db
 from app.models.tracker_field import TrackerField
@@ -22,21 +23,35 @@ class FieldOrderingService:
     2. Category-specific fields (e.g., period_tracker, workout_tracker - fixed position)
     3. Custom category fields (TrackerField with field_group='custom' - user can reorder)
     4. User fields (TrackerUserField - user can reorder within their own tracker)
+    
+    Tiers 1-3 use dense orders (offset + position), since the offset of each
+    tier is the number of fields before it. User fields are the last tier, so
+    their orders are spaced USER_FIELD_ORDER_GAP apart starting one gap above
+    the offset (offset + gap * (position + 1)), and a move - to the front
+    included - only rewrites the moved field.
+    
+    Each public method runs its reads and writes in the session's current
+    transaction and commits once at the end (rolling back on error). That is
+    one transaction and one COMMIT, not one snapshot: under READ COMMITTED
+    (the Postgres default) every statement sees the latest committed data, so
+    a concurrent reorder can land between the position checks and the UPDATEs.
     """
+    
+    USER_FIELD_ORDER_GAP = 1024
 
     @staticmethod
-    def update_tracker_field_order(field_id: int, new_relative_order: int) -> None:
+    def update_tracker_field_order(field_id: int, new_relative_order: int) -> Dict[int, int]:
         """
         Reorder a TrackerField (custom category field).
         
         Args:
             field_id: ID of TrackerField to reorder
             new_relative_order: New position within custom fields (0-based)
+        
+        Returns:
+            New field_order of every custom field that changed, keyed by ID
         """
         try:
-            # Expire cache to ensure fresh data
-            db.session.expire_all()
-            
             field = TrackerField.query.filter_by(id=field_id).first()
             if not field:
                 raise ValueError("Field not found")
@@ -47,129 +62,220 @@ class FieldOrderingService:
             if field.field_group != 'custom':
                 raise ValueError("Can only reorder custom fields")
             
-            # Get all ACTIVE custom fields for this category (sorted by current order)
-            custom_fields = TrackerField.query.filter_by(
-                category_id=field.category_id,
-                field_group='custom',
-                is_active=True
-            ).order_by(TrackerField.field_order.asc()).all()
+            # All ACTIVE custom fields for this category
+            siblings = (
+                TrackerField.category_id == field.category_id,
+                TrackerField.field_group == 'custom',
+                TrackerField.is_active == True
+            )
             
-            if not custom_fields:
-                return  # No fields to reorder
+            # Count siblings and locate the field among them (no row fetch)
+            total, current_relative_order = FieldOrderingService._sibling_position(
+                TrackerField, siblings, field
+            )
+            
+            if not total:
+                return {}  # No fields to reorder
             
             # Validate new order
-            if new_relative_order < 0 or new_relative_order >= len(custom_fields):
+            if new_relative_order < 0 or new_relative_order >= total:
                 raise ValueError(
-                    f"Invalid order. Must be between 0 and {len(custom_fields) - 1}"
+                    f"Invalid order. Must be between 0 and {total - 1}"
                 )
             
+            if not field.is_active:
+                raise ValueError("Field not found in fields list")
+            
+            # No change needed - skip the offset queries and the write
+            if current_relative_order == new_relative_order:
+                return {}
+            
             # Calculate offset (baseline + category-specific fields)
             offset = FieldOrderingService._get_category_offset(field.category_id)
             
             # Perform reordering
-            FieldOrderingService._reorder_fields(
-                fields=custom_fields,
+            changed_orders = FieldOrderingService._reorder_fields(
+                model=TrackerField,
+                siblings=siblings,
                 field_to_move=field,
+                current_relative_order=current_relative_order,
                 new_relative_order=new_relative_order,
                 offset=offset
             )
             
-            # Commit changes
+            # Orders changed - drop this request's cached field lists
+            g.pop('_ordered_fields_cache', None)
+            
+            # Commit changes (commit expires loaded instances, so the next
+            # read gets fresh data)
             db.session.commit()
             
-            # Expire again to ensure next read gets fresh data
-            db.session.expire_all()
+            return changed_orders
             
         except Exception as e:
             db.session.rollback()
             raise
     
     @staticmethod
-    def update_user_field_order(field_id: int, new_relative_order: int) -> None:
+    def update_user_field_order(field_id: int, new_relative_order: int) -> Dict[int, int]:
         """
         Reorder a TrackerUserField.
         
         Args:
             field_id: ID of TrackerUserField to reorder
             new_relative_order: New position within user fields (0-based)
+        
+        Returns:
+            New field_order of every user field that changed, keyed by ID
         """
         try:
-            # Expire cache to ensure fresh data
-            db.session.expire_all()
-            
-            field = TrackerUserField.query.filter_by(id=field_id).first()
-            if not field:
+            # Load the field with its tracker's category in one round trip
+            row = db.session.query(
+                TrackerUserField, Tracker.category_id
+            ).outerjoin(
+                Tracker, Tracker.id == TrackerUserField.tracker_id
+            ).filter(TrackerUserField.id == field_id).first()
+            if not row:
                 raise ValueError("Field not found")
             
-            # Get all ACTIVE user fields for this tracker (sorted by current order)
-            user_fields = TrackerUserField.query.filter_by(
-                tracker_id=field.tracker_id,
-                is_active=True
-            ).order_by(TrackerUserField.field_order.asc()).all()
+            field, category_id = row
             
-            if not user_fields:
-                return  # No fields to reorder
+            # All ACTIVE user fields for this tracker
+            siblings = (
+                TrackerUserField.tracker_id == field.tracker_id,
+                TrackerUserField.is_active == True
+            )
+            
+            # Count siblings and locate the field among them (no row fetch)
+            total, current_relative_order = FieldOrderingService._sibling_position(
+                TrackerUserField, siblings, field
+            )
+            
+            if not total:
+                return {}  # No fields to reorder
             
             # Validate new order
-            if new_relative_order < 0 or new_relative_order >= len(user_fields):
+            if new_relative_order < 0 or new_relative_order >= total:
                 raise ValueError(
-                    f"Invalid order. Must be between 0 and {len(user_fields) - 1}"
+                    f"Invalid order. Must be between 0 and {total - 1}"
                 )
             
-            # Get tracker to calculate offset
-            tracker = Tracker.query.filter_by(id=field.tracker_id).first()
-            if not tracker:
+            if not field.is_active:
+                raise ValueError("Field not found in fields list")
+            
+            if category_id is None:
                 raise ValueError("Tracker not found")
             
+            # No change needed - skip the offset queries and the write
+            if current_relative_order == new_relative_order:
+                return {}
+            
             # Calculate offset (baseline + category-specific + custom category fields)
-            offset = FieldOrderingService._get_tracker_offset(tracker.category_id)
+            offset = FieldOrderingService._get_tracker_offset(category_id)
             
             # Perform reordering
-            FieldOrderingService._reorder_fields(
-                fields=user_fields,
+            changed_orders = FieldOrderingService._move_user_field(
+                siblings=siblings,
                 field_to_move=field,
+                current_relative_order=current_relative_order,
                 new_relative_order=new_relative_order,
                 offset=offset
             )
             
-            # Commit changes
+            # Orders changed - drop this request's cached field lists
+            g.pop('_ordered_fields_cache', None)
+            
+            # Commit changes (commit expires loaded instances, so the next
+            # read gets fresh data)
             db.session.commit()
             
-            # Expire again to ensure next read gets fresh data
-            db.session.expire_all()
+            return changed_orders
             
         except Exception as e:
             db.session.rollback()
             raise
     
     @staticmethod
-    def _get_category_offset(category_id: int) -> int:
+    def _move_user_field(siblings: tuple,
+                         field_to_move: TrackerUserField,
+                         current_relative_order: int,
+                         new_relative_order: int,
+                         offset: int) -> Dict[int, int]:
         """
-        Calculate the starting offset for custom category fields.
-        Offset = baseline fields + category-specific fields
+        Move a user field by giving it an order between its new neighbours.
+        
+        Only the two neighbours are read (LIMIT 2 on the sibling ordering)
+        and only the moved row is written. When the neighbours leave no room
+        (e.g. orders are still dense), the tier is respaced with
+        USER_FIELD_ORDER_GAP instead.
+        
+        Returns:
+            New field_order of each changed row keyed by ID
         """
-        # Count ACTIVE baseline fields
-        baseline_count = TrackerField.query.filter_by(
-            category_id=category_id,
-            field_group='baseline',
-            is_active=True
-        ).count()
+        gap = FieldOrderingService.USER_FIELD_ORDER_GAP
         
-        # Count ACTIVE category-specific fields (for prebuilt categories only)
-        category = TrackerCategory.query.filter_by(id=category_id).first()
-        category_specific_count = 0
+        # Orders around the new position, ignoring the moved field itself
+        neighbours = [
+            order for order, in db.session.query(TrackerUserField.field_order)
+            .filter(*siblings, TrackerUserField.id != field_to_move.id)
+            .order_by(TrackerUserField.field_order, TrackerUserField.id)
+            .offset(max(new_relative_order - 1, 0))
+            .limit(2)
+            .all()
+        ]
         
-        if category and is_prebuilt_category(category.name):
-            config_key = get_category_config_key(category.name)
-            
-            if config_key:
-                category_specific_count = TrackerField.query.filter_by(
-                    category_id=category_id,
-                    field_group=config_key,
-                    is_active=True
-                ).count()
+        if new_relative_order == 0:
+            # Moving to the front: the first slot sits a gap above the tier
+            # offset, so there is room below the current first field
+            prev_order, next_order = offset, neighbours[0]
+        else:
+            prev_order = neighbours[0]
+            next_order = neighbours[1] if len(neighbours) > 1 else None
+        
+        if next_order is None:
+            new_order = prev_order + gap
+        elif next_order - prev_order >= 2:
+            new_order = (prev_order + next_order) // 2
+        else:
+            # No room between the neighbours - respace the whole tier, with
+            # the first field one gap above the offset
+            return FieldOrderingService._reorder_fields(
+                model=TrackerUserField,
+                siblings=siblings,
+                field_to_move=field_to_move,
+                current_relative_order=current_relative_order,
+                new_relative_order=new_relative_order,
+                offset=offset + gap,
+                gap=gap
+            )
+        
+        field_to_move.field_order = new_order
+        return {field_to_move.id: new_order}
+    
+    @staticmethod
+    def next_user_field_order(tracker_id: int, category_id: int) -> int:
+        """
+        field_order for a new user field appended to a tracker.
+        
+        One USER_FIELD_ORDER_GAP after the last user field, or after the tier
+        offset for the first one, leaving room for later moves.
+        """
+        max_order = db.session.query(func.max(TrackerUserField.field_order)).filter_by(
+            tracker_id=tracker_id
+        ).scalar()
         
-        return baseline_count + category_specific_count
+        if max_order is None:
+            max_order = FieldOrderingService._get_tracker_offset(category_id)
+        return max_order + FieldOrderingService.USER_FIELD_ORDER_GAP
+    
+    @staticmethod
+    def _get_category_offset(category_id: int) -> int:
+        """
+        Calculate the starting offset for custom category fields.
+        Offset = baseline fields + category-specific fields
+        """
+        groups = FieldOrderingService._get_fixed_field_groups(category_id)
+        return FieldOrderingService._count_active_fields(category_id, groups)
     
     @staticmethod
     def _get_tracker_offset(category_id: int) -> int:
@@ -177,59 +283,136 @@ class FieldOrderingService:
         Calculate the starting offset for user fields.
         Offset = baseline + category-specific + custom category fields
         """
-        base_offset = FieldOrderingService._get_category_offset(category_id)
+        groups = FieldOrderingService._get_fixed_field_groups(category_id) + ['custom']
+        return FieldOrderingService._count_active_fields(category_id, groups)
+    
+    @staticmethod
+    def _get_fixed_field_groups(category_id: int) -> List[str]:
+        """
+        Field groups that sit before custom fields: baseline, plus the
+        category-specific group for prebuilt categories.
+        """
+        _, config_key, _ = FieldOrderingService._category_meta(category_id)
+        return ['baseline', config_key] if config_key else ['baseline']
+    
+    @staticmethod
+    def _category_meta(category_id: int) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Return (category_name, config_key, is_prebuilt) for a category.
         
-        # Add ACTIVE custom category fields
-        custom_count = TrackerField.query.filter_by(
-            category_id=category_id,
-            field_group='custom',
-            is_active=True
-        ).count()
+        Cached on flask.g so repeated lookups within one request skip the
+        category SELECT and the prebuilt/config-key resolution.
+        """
+        cache = g.setdefault('_category_meta_cache', {})
+        if category_id in cache:
+            return cache[category_id]
+        
+        category = db.session.get(TrackerCategory, category_id)
+        if category and is_prebuilt_category(category.name):
+            meta = (category.name, get_category_config_key(category.name), True)
+        else:
+            meta = (category.name if category else None, None, False)
+        
+        cache[category_id] = meta
+        return meta
+    
+    @staticmethod
+    def _count_active_fields(category_id: int, groups: List[str]) -> int:
+        """Count ACTIVE TrackerFields across field groups with one grouped COUNT query."""
+        counts = db.session.query(
+            TrackerField.field_group,
+            func.count(TrackerField.id)
+        ).filter(
+            TrackerField.category_id == category_id,
+            TrackerField.is_active == True,
+            TrackerField.field_group.in_(groups)
+        ).group_by(TrackerField.field_group).all()
+        
+        return sum(count for _, count in counts)
+    
+    @staticmethod
+    def _sibling_position(model, siblings: tuple,
+                          field: Union[TrackerField, TrackerUserField]) -> Tuple[int, int]:
+        """
+        Return (number of siblings, field's 0-based position among them).
         
-        return base_offset + custom_count
+        Both come from a single aggregate query, so validating a move never
+        needs the sibling rows themselves. Position follows the same
+        (field_order, id) ordering used by _reorder_fields.
+        """
+        before = or_(
+            model.field_order < field.field_order,
+            and_(model.field_order == field.field_order, model.id < field.id)
+        )
+        total, position = db.session.query(
+            func.count(model.id),
+            func.coalesce(func.sum(case((before, 1), else_=0)), 0)
+        ).filter(*siblings).one()
+        
+        return int(total), int(position)
     
     @staticmethod
-    def _reorder_fields(fields: List[Union[TrackerField, TrackerUserField]],
-                       field_to_move: Union[TrackerField, TrackerUserField],
-                       new_relative_order: int,
-                       offset: int) -> None:
+    def _reorder_fields(model,
+                        siblings: tuple,
+                        field_to_move: Union[TrackerField, TrackerUserField],
+                        current_relative_order: int,
+                        new_relative_order: int,
+                        offset: int,
+                        gap: int = 1) -> Dict[int, int]:
         """
-        Core reordering logic using list manipulation.
+        Core reordering logic, done in SQL. Callers handle the no-op case
+        (current == new) before computing the offset.
         
         Algorithm:
-        1. Find current position of field to move
-        2. Remove field from list
-        3. Insert field at new position
-        4. Reassign all field_order values sequentially with offset
+        1. Number siblings by current order with row_number()
+        2. Put the moved field at the new position
+        3. Shift the fields between the old and new position by one
+        4. Reassign field_order values (offset + position * gap), written as
+           a single UPDATE ... FROM statement that skips rows already holding
+           their target value (typically everything outside the moved range)
+        
+        Returns:
+            New field_order of each changed row keyed by ID, read back via
+            UPDATE ... RETURNING
         """
-        # Find current relative position
-        current_relative_order = None
-        for i, f in enumerate(fields):
-            if f.id == field_to_move.id:
-                current_relative_order = i
-                break
-        
-        if current_relative_order is None:
-            raise ValueError("Field not found in fields list")
-        
-        # No change needed
-        if current_relative_order == new_relative_order:
-            return
-        
-        # Create new ordered list by removing and inserting
-        reordered_fields = fields.copy()
-        reordered_fields.pop(current_relative_order)
-        reordered_fields.insert(new_relative_order, field_to_move)
-        
-        # Reassign ALL field_order values sequentially
-        for index, field in enumerate(reordered_fields):
-            new_order_value = offset + index
-            field.field_order = new_order_value
-            # Explicitly add to session to track changes
-            db.session.add(field)
-        
-        # Flush to ensure changes are written
-        db.session.flush()
+        ranked = select(
+            model.id,
+            (func.row_number().over(
+                order_by=(model.field_order, model.id)
+            ) - 1).label('position')
+        ).where(*siblings).subquery()
+        
+        if new_relative_order > current_relative_order:
+            # Moving down: fields in between move up one slot
+            shifted = ranked.c.position.between(current_relative_order + 1, new_relative_order)
+            step = -1
+        else:
+            # Moving up: fields in between move down one slot
+            shifted = ranked.c.position.between(new_relative_order, current_relative_order - 1)
+            step = 1
+        
+        new_position = case(
+            (ranked.c.id == field_to_move.id, new_relative_order),
+            (shifted, ranked.c.position + step),
+            else_=ranked.c.position
+        )
+        
+        new_order = new_position * gap + offset
+        updated = db.session.execute(
+            update(model)
+            .where(
+                model.id == ranked.c.id,
+                model.field_order.is_distinct_from(new_order)
+            )
+            .values(field_order=new_order)
+            .returning(model.id, model.field_order)
+            .execution_options(synchronize_session=False)
+        ).all()
+        
+        # The loaded instance still holds the old value; reload on next access
+        db.session.expire(field_to_move, ['field_order'])
+        
+        return {row.id: row.field_order for row in updated}
     
     @staticmethod
     def get_all_ordered_fields(category_id: int, tracker_id: int = None) -> dict:
@@ -238,7 +421,15 @@ class FieldOrderingService:
         
         Returns:
             Dictionary with field groups in display order
+        
+        Results are cached on flask.g for the rest of the request; the
+        reorder and normalize methods drop the cache when they commit.
         """
+        cache = g.setdefault('_ordered_fields_cache', {})
+        key = (category_id, tracker_id)
+        if key in cache:
+            return cache[key]
+        
         result = {
             'baseline': [],
             'category_specific': [],
@@ -246,32 +437,24 @@ class FieldOrderingService:
             'user': []
         }
         
-        # 1. Baseline fields
-        result['baseline'] = TrackerField.query.filter_by(
-            category_id=category_id,
-            field_group='baseline',
-            is_active=True
-        ).order_by(TrackerField.field_order.asc()).all()
+        # 1-3. Baseline, category-specific (prebuilt only) and custom fields,
+        # fetched in one query and bucketed by group
+        _, config_key, _ = FieldOrderingService._category_meta(category_id)
+        groups = ['baseline', 'custom'] + ([config_key] if config_key else [])
         
-        # 2. Category-specific fields (for prebuilt categories)
-        category = TrackerCategory.query.filter_by(id=category_id).first()
-        if category and is_prebuilt_category(category.name):
-            config_key = get_category_config_key(category.name)
-            
-            if config_key:
-                result['category_specific'] = TrackerField.query.filter_by(
-                    category_id=category_id,
-                    field_group=config_key,
-                    is_active=True
-                ).order_by(TrackerField.field_order.asc()).all()
-        
-        # 3. Custom category fields
-        result['custom'] = TrackerField.query.filter_by(
+        fields = TrackerField.query.filter_by(
             category_id=category_id,
-            field_group='custom',
             is_active=True
+        ).filter(
+            TrackerField.field_group.in_(groups)
         ).order_by(TrackerField.field_order.asc()).all()
         
+        for field in fields:
+            if field.field_group in ('baseline', 'custom'):
+                result[field.field_group].append(field)
+            else:
+                result['category_specific'].append(field)
+        
         # 4. User fields (if tracker_id provided)
         if tracker_id:
             result['user'] = TrackerUserField.query.filter_by(
@@ -279,6 +462,7 @@ class FieldOrderingService:
                 is_active=True
             ).order_by(TrackerUserField.field_order.asc()).all()
         
+        cache[key] = result
         return result
     
     # ========================================================================
@@ -289,34 +473,40 @@ class FieldOrderingService:
     def update_option_order(option_id: int, new_relative_order: int) -> None:
         """
         Reorder a FieldOption within its parent field.
-        Uses the same robust list insertion approach as field reordering.
+        Splices the option into its new position in the sibling id list.
         """
         try:
-            # Expire cache to ensure fresh data
-            db.session.expire_all()
-            
-            option = FieldOption.query.filter_by(id=option_id).first()
-            if not option:
+            # Fetch the option together with all ACTIVE options of its parent
+            # field (sorted by current order) in one statement.
+            # Check user field first to avoid ID collision (same as verify_field_ownership)
+            target = select(
+                FieldOption.tracker_user_field_id,
+                FieldOption.tracker_field_id
+            ).where(FieldOption.id == option_id).cte('target')
+            
+            same_parent = or_(
+                and_(
+                    target.c.tracker_user_field_id.isnot(None),
+                    FieldOption.tracker_user_field_id == target.c.tracker_user_field_id
+                ),
+                and_(
+                    target.c.tracker_user_field_id.is_(None),
+                    FieldOption.tracker_field_id == target.c.tracker_field_id
+                )
+            )
+            # Only id/active/order columns are needed - no ORM instances
+            rows = db.session.query(
+                FieldOption.id,
+                FieldOption.is_active,
+                FieldOption.option_order
+            ).join(target, same_parent).filter(
+                or_(FieldOption.is_active == True, FieldOption.id == option_id)
+            ).order_by(FieldOption.option_order.asc()).all()
+            
+            if not any(row.id == option_id for row in rows):
                 raise ValueError("Option not found")
             
-            # Validate that option has a valid parent field reference
-            if not option.tracker_user_field_id and not option.tracker_field_id:
-                raise ValueError("Option has no valid parent field reference")
-            
-            # Get all ACTIVE options for this field (sorted by current order)
-            # Check user field first to avoid ID collision (same as verify_field_ownership)
-            if option.tracker_user_field_id:
-                options = FieldOption.query.filter_by(
-                    tracker_user_field_id=option.tracker_user_field_id,
-                    is_active=True
-                ).order_by(FieldOption.option_order.asc()).all()
-            elif option.tracker_field_id:
-                options = FieldOption.query.filter_by(
-                    tracker_field_id=option.tracker_field_id,
-                    is_active=True
-                ).order_by(FieldOption.option_order.asc()).all()
-            else:
-                raise ValueError("Option has no valid field reference")
+            options = [row for row in rows if row.is_active]
             
             if not options:
                 return  # No options to reorder
@@ -328,10 +518,8 @@ class FieldOrderingService:
                 )
             
             # Find current position
-            current_relative_order = next(
-                (i for i, opt in enumerate(options) if opt.id == option.id),
-                None
-            )
+            positions = {row.id: i for i, row in enumerate(options)}
+            current_relative_order = positions.get(option_id)
             
             if current_relative_order is None:
                 raise ValueError("Option not found in options list")
@@ -340,20 +528,31 @@ class FieldOrderingService:
             if current_relative_order == new_relative_order:
                 return
             
-            # Create new ordered list using list insertion
-            new_order = options.copy()
-            new_order.pop(current_relative_order)
-            new_order.insert(new_relative_order, option)
+            # Create new ordered id list: drop the option, then splice it back
+            # in at its new position
+            option_ids = [row.id for row in options]
+            new_order = option_ids[:current_relative_order] + option_ids[current_relative_order + 1:]
+            new_order[new_relative_order:new_relative_order] = [option_id]
+            
+            # Update option orders (no offset needed - options start at 0),
+            # writing only rows whose order actually changes
+            current_orders = {row.id: row.option_order for row in options}
+            changed_orders = {
+                opt_id: index for index, opt_id in enumerate(new_order)
+                if current_orders[opt_id] != index
+            }
+            db.session.execute(
+                update(FieldOption)
+                .where(FieldOption.id.in_(changed_orders))
+                .values(option_order=case(changed_orders, value=FieldOption.id))
+                .execution_options(synchronize_session=False)
+            )
             
-            # Update ALL option orders (no offset needed - options start at 0)
-            for index, opt in enumerate(new_order):
-                opt.option_order = index
-                db.session.add(opt)
-                flag_modified(opt, 'option_order')
+            # Orders changed - drop this request's cached field lists
+            g.pop('_ordered_fields_cache', None)
             
             # Commit changes
             db.session.commit()
-            db.session.expire_all()
             
         except Exception as e:
             db.session.rollback()
@@ -368,67 +567,67 @@ class FieldOrderingService:
         """
         Normalize all field orders to ensure they're sequential with proper offsets.
         Use this to fix corrupted ordering or after bulk operations.
+        
+        Orders are recomputed server-side with row_number(): one UPDATE for
+        category fields (baseline, category-specific, custom, in that order)
+        and one for user fields, spaced USER_FIELD_ORDER_GAP apart from one gap
+        above the number of category fields.
         """
         try:
-            offset = 0
+            groups = FieldOrderingService._get_fixed_field_groups(category_id) + ['custom']
             
-            # 1. Normalize baseline fields (order 0, 1, 2, ...)
-            baseline_fields = TrackerField.query.filter_by(
-                category_id=category_id,
-                field_group='baseline',
-                is_active=True
-            ).order_by(TrackerField.field_order.asc()).all()
-            
-            for i, field in enumerate(baseline_fields):
-                field.field_order = i
-                db.session.add(field)
-            
-            offset += len(baseline_fields)
-            
-            # 2. Normalize category-specific fields
-            category = TrackerCategory.query.filter_by(id=category_id).first()
-            if category and is_prebuilt_category(category.name):
-                config_key = get_category_config_key(category.name)
-                
-                if config_key:
-                    category_fields = TrackerField.query.filter_by(
-                        category_id=category_id,
-                        field_group=config_key,
-                        is_active=True
-                    ).order_by(TrackerField.field_order.asc()).all()
-                    
-                    for i, field in enumerate(category_fields):
-                        field.field_order = offset + i
-                        db.session.add(field)
-                    
-                    offset += len(category_fields)
-            
-            # 3. Normalize custom category fields
-            custom_fields = TrackerField.query.filter_by(
-                category_id=category_id,
-                field_group='custom',
-                is_active=True
-            ).order_by(TrackerField.field_order.asc()).all()
-            
-            for i, field in enumerate(custom_fields):
-                field.field_order = offset + i
-                db.session.add(field)
-            
-            offset += len(custom_fields)
+            # 1-3. Baseline, category-specific and custom fields: rank groups in
+            # display order, then number rows sequentially across them
+            group_rank = case(
+                {group: rank for rank, group in enumerate(groups)},
+                value=TrackerField.field_group
+            )
+            category_active = (
+                TrackerField.category_id == category_id,
+                TrackerField.is_active == True,
+                TrackerField.field_group.in_(groups)
+            )
+            ranked_fields = select(
+                TrackerField.id,
+                (func.row_number().over(
+                    order_by=(group_rank, TrackerField.field_order, TrackerField.id)
+                ) - 1).label('new_order')
+            ).where(*category_active).subquery()
+            
+            db.session.execute(
+                update(TrackerField)
+                .where(TrackerField.id == ranked_fields.c.id)
+                .values(field_order=ranked_fields.c.new_order)
+                .execution_options(synchronize_session=False)
+            )
             
             # 4. Normalize user fields (if tracker provided)
             if tracker_id:
-                user_fields = TrackerUserField.query.filter_by(
-                    tracker_id=tracker_id,
-                    is_active=True
-                ).order_by(TrackerUserField.field_order.asc()).all()
+                offset = select(
+                    func.count(TrackerField.id)
+                ).where(*category_active).scalar_subquery()
                 
-                for i, field in enumerate(user_fields):
-                    field.field_order = offset + i
-                    db.session.add(field)
+                ranked_user_fields = select(
+                    TrackerUserField.id,
+                    (func.row_number().over(
+                        order_by=(TrackerUserField.field_order, TrackerUserField.id)
+                    ) * FieldOrderingService.USER_FIELD_ORDER_GAP + offset).label('new_order')
+                ).where(
+                    TrackerUserField.tracker_id == tracker_id,
+                    TrackerUserField.is_active == True
+                ).subquery()
+                
+                db.session.execute(
+                    update(TrackerUserField)
+                    .where(TrackerUserField.id == ranked_user_fields.c.id)
+                    .values(field_order=ranked_user_fields.c.new_order)
+                    .execution_options(synchronize_session=False)
+                )
             
+            # Orders changed - drop this request's cached field lists
+            g.pop('_ordered_fields_cache', None)
             db.session.commit()
             
         except Exception as e:
             db.session.rollback()
-            raise
\ No newline at end of file
+            raise
@@ -8,14 +8,244 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import numpy as np
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Dict, Any, List
+from functools import lru_cache
+from matplotlib.figure import Figure
+from matplotlib.patches import BoxStyle
+from typing import Dict, Any, List, Optional, Tuple
 import seaborn as sns
+from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont
 from datetime import date, timedelta
 
+# savefig arguments per output format. Charts are served straight to the
+# client, so PNG favours encode speed over size; WebP/JPEG are lossy and
+# smaller still
+_SAVE_KWARGS = {
+    'png': {'format': 'png', 'pil_kwargs': {'compress_level': 1}},
+    'webp': {'format': 'webp', 'pil_kwargs': {'quality': 80, 'method': 4}},
+    'jpeg': {'format': 'jpeg', 'pil_kwargs': {'quality': 80}},
+}
+
+# Shared worker threads for generate_pattern_charts_bulk (one per chart type).
+# They live for the whole process, so their per-thread pooled figures are
+# reused across bulk calls instead of dying with a per-call executor
+_BULK_MAX_WORKERS = 4
+_bulk_pool = ThreadPoolExecutor(
+    max_workers=_BULK_MAX_WORKERS, thread_name_prefix='pattern-chart'
+)
+
+# Finished images keyed by chart type, field, format and a digest of the
+# pattern data - charts are a pure function of those, and polling dashboards
+# ask for the same ones repeatedly. Least recently used entries are evicted.
+_CHART_CACHE_SIZE = 256
+_chart_cache: "OrderedDict[Tuple[str, str, str, bytes], bytes]" = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_DAY_IDX = {day: i for i, day in enumerate(_DAYS)}
+
+# Time-of-month periods shown by the calendar chart, with labels and colours
+_PERIODS = ('early_month', 'mid_month', 'late_month', 'end_of_month')
+_PERIOD_LABELS = ('Early', 'Mid', 'Late', 'End')
+_PERIOD_COLORS = plt.cm.RdYlGn(np.linspace(0.3, 0.9, len(_PERIODS)))
+
+# Bar chart text per pattern type: (label, annotation when confidence >= 0.7,
+# annotation otherwise), formatted with the pattern's own keys
+_BAR_TEXT_FORMATS = {
+    'Day of Week': ('📅 {label}',
+                    'Strong weekly pattern (observed {value:.0f} times)',
+                    'Weekly trend (confidence: {confidence:.0%})'),
+    'Time of Month': ('📆 {label}',
+                      'Monthly pattern (avg: {value:.1f})',
+                      'Monthly pattern (avg: {value:.1f})'),
+    'Streak': ('🔥 {label}',
+               'Consecutive pattern (length: {value} days)',
+               'Consecutive pattern (length: {value} days)'),
+}
+_BAR_TEXT_DEFAULT = ('{type}: {label}', 'Confidence: {confidence:.0%}', 'Confidence: {confidence:.0%}')
+
+# Polar angle of each weekday, with Monday repeated to close the circle
+_POLAR_ANGLES = np.append(np.linspace(0, 2 * np.pi, len(_DAYS), endpoint=False), 0.0)
+
+# Text box styles, built once and shared (Text copies the dict it is given)
+_HEATMAP_CELL_BBOX = dict(boxstyle=BoxStyle.Round(pad=0.5), facecolor='white', alpha=0.3,
+                          edgecolor='black', linewidth=1)
+_INSIGHT_BBOX = dict(boxstyle=BoxStyle.Round(), facecolor='lightyellow', alpha=0.8,
+                     edgecolor='orange', linewidth=2)
+_SUMMARY_BBOX = dict(boxstyle=BoxStyle.Round(), facecolor='lightblue', alpha=0.7)
+# Bar chart annotation boxes, keyed by the bar's confidence colour
+_BAR_ANNOTATION_BBOXES = {
+    color: dict(boxstyle=BoxStyle.Round(pad=0.5), facecolor='white', alpha=0.8,
+                edgecolor=color, linewidth=1.5)
+    for color in ('#4CAF50', '#FFC107', '#FF9800')
+}
+
+# Per-thread figures reused across renders, keyed by (chart kind, figsize).
+# They are plain Figure objects (not registered with pyplot), so each thread
+# owns its figures and no lock is needed.
+_figure_pool = threading.local()
+
+
+def _acquire_figure(kind: str, figsize, **subplots_kwargs):
+    """Return a cleared pooled figure and freshly added axes for a chart kind."""
+    figures = getattr(_figure_pool, 'figures', None)
+    if figures is None:
+        figures = _figure_pool.figures = {}
+    
+    fig = figures.get((kind, figsize))
+    if fig is None:
+        fig = figures[(kind, figsize)] = Figure(figsize=figsize)
+    else:
+        fig.clf()
+        _reset_subplot_params(fig)
+    
+    return fig, fig.subplots(**subplots_kwargs)
+
+
+def _reset_subplot_params(fig: Figure) -> None:
+    """Restore default subplot spacing (clf() keeps what tight_layout left behind)."""
+    fig.subplots_adjust(**{
+        key: matplotlib.rcParams[f'figure.subplot.{key}']
+        for key in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+    })
+
+
+def _acquire_polar_frame():
+    """
+    Return the per-thread weekly polar figure as (fig, ax, line, area).
+    
+    The wheel (day ticks, grid, legend) is drawn once per thread; callers
+    only swap in new data and a title, then rescale the radial axis.
+    """
+    frame = getattr(_figure_pool, 'polar_frame', None)
+    if frame is not None:
+        _reset_subplot_params(frame[0])
+        return frame
+    
+    fig = Figure(figsize=(10, 10))
+    ax = fig.add_subplot(projection='polar')
+    
+    line, = ax.plot(_POLAR_ANGLES, np.zeros(len(_POLAR_ANGLES)), 'o-', linewidth=2,
+                    color='#2196F3', label='Average Value')
+    area, = ax.fill(_POLAR_ANGLES, np.zeros(len(_POLAR_ANGLES)), alpha=0.25, color='#2196F3')
+    
+    ax.set_xticks(_POLAR_ANGLES[:-1])
+    ax.set_xticklabels(_DAYS)
+    ax.grid(True)
+    ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
+    
+    frame = _figure_pool.polar_frame = (fig, ax, line, area)
+    return frame
+
+
+def _figure_bytes(fig: Figure, image_format: str, **savefig_kwargs) -> bytes:
+    """
+    Encode a figure in the given format.
+    
+    BytesIO.getvalue() hands over the written buffer without copying it when
+    nothing else references it, so no extra copy is made on the way out.
+    """
+    buffer = BytesIO()
+    fig.savefig(buffer, dpi=100, **_SAVE_KWARGS[image_format], **savefig_kwargs)
+    return buffer.getvalue()
+
+
+def _chart_cache_key(pattern_data: Dict[str, Any], field_name: str,
+                     chart_type: str, image_format: str) -> Optional[Tuple[str, str, str, bytes]]:
+    """Cache key for a chart request, or None if the pattern data can't be serialised."""
+    try:
+        payload = json.dumps(pattern_data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        # e.g. dict keys of mixed types, which sort_keys can't order
+        return None
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).digest()
+    return chart_type, field_name, image_format, digest
+
+
+def _cached_chart(key) -> Optional[bytes]:
+    """Return cached image bytes for key (marking them recently used), or None."""
+    with _chart_cache_lock:
+        image = _chart_cache.get(key)
+        if image is not None:
+            _chart_cache.move_to_end(key)
+        return image
+
+
+def _store_chart(key, image: bytes) -> None:
+    """Cache image bytes under key, evicting the least recently used entry when full."""
+    with _chart_cache_lock:
+        _chart_cache[key] = image
+        _chart_cache.move_to_end(key)
+        if len(_chart_cache) > _CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+
+
+def _parse_frequency(pattern: Dict[str, Any]) -> int:
+    """Count from a frequency like "5/10", falling back to the pattern's 'count'."""
+    try:
+        head, sep, _ = pattern.get('frequency', '0/0').partition('/')
+        if sep:
+            return int(head)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return pattern.get('count', 0)
+
+
+# Placeholder canvas (a 10x6 inch figure at the charts' 100 dpi) and the
+# 14pt matplotlib text size in pixels at that dpi
+_NO_DATA_SIZE = (1000, 600)
+_NO_DATA_FONT_PX = round(14 * 100 / 72)
+
+
+@lru_cache(maxsize=1)
+def _no_data_font():
+    """Matplotlib's default sans-serif font for the placeholder text, loaded once."""
+    try:
+        return ImageFont.truetype(font_manager.findfont('DejaVu Sans'), _NO_DATA_FONT_PX)
+    except OSError:
+        return ImageFont.load_default(_NO_DATA_FONT_PX)
+
+
+@lru_cache(maxsize=64)
+def _no_data_image(message: str, image_format: str) -> bytes:
+    """
+    Draw the placeholder chart for a message (cached - the image is static).
+    
+    Just centred grey text on white, so it is drawn with Pillow directly
+    rather than laying out a whole matplotlib figure.
+    """
+    image = Image.new('RGB', _NO_DATA_SIZE, 'white')
+    ImageDraw.Draw(image).multiline_text(
+        (_NO_DATA_SIZE[0] // 2, _NO_DATA_SIZE[1] // 2), message,
+        fill='gray', font=_no_data_font(), anchor='mm', align='center'
+    )
+    
+    save_kwargs = _SAVE_KWARGS[image_format]
+    buffer = BytesIO()
+    image.save(buffer, save_kwargs['format'], **save_kwargs['pil_kwargs'])
+    return buffer.getvalue()
+
 
 class PatternChartService:
-    """Service for generating pattern visualization charts."""
+    """
+    Service for generating pattern visualization charts.
+    
+    Pattern payloads come from PatternRecognitionService (or JSON) and are
+    always plain dicts/lists, so shape checks use exact type() comparisons.
+    """
+    
+    # Supported output formats and their MIME types
+    IMAGE_FORMATS = {
+        'png': 'image/png',
+        'webp': 'image/webp',
+        'jpeg': 'image/jpeg'
+    }
     
     @staticmethod
     def generate_pattern_chart(
@@ -23,7 +253,8 @@ class PatternChartService:
         tracker_id: int,
         field_name: str,
         chart_type: str = 'heatmap',
-        months: int = 3
+        months: int = 3,
+        image_format: str = 'png'
     ) -> bytes:
         """
         Generate pattern visualization chart.
@@ -34,14 +265,21 @@ class PatternChartService:
             field_name: Field being analyzed
             chart_type: Type of chart ('heatmap', 'calendar', 'polar', 'bar')
             months: Number of months analyzed
+            image_format: Output format ('png', 'webp', 'jpeg')
         
         Returns:
-            PNG image as bytes
+            Image as bytes in the requested format
         """
+        if image_format not in PatternChartService.IMAGE_FORMATS:
+            raise ValueError(
+                f"Invalid image_format. Must be one of: {', '.join(PatternChartService.IMAGE_FORMATS)}"
+            )
+        
         # Check if patterns exist
         if pattern_data.get('message'):
             return PatternChartService._generate_no_data_chart(
-                pattern_data.get('message', 'No patterns detected')
+                pattern_data.get('message', 'No patterns detected'),
+                image_format
             )
         
         # Check has_patterns flag or patterns dictionary
@@ -50,102 +288,133 @@ class PatternChartService:
         
         if not has_patterns and not patterns:
             return PatternChartService._generate_no_data_chart(
-                'No patterns detected'
+                'No patterns detected',
+                image_format
             )
         
-        if chart_type == 'calendar':
-            return PatternChartService._generate_calendar_chart(pattern_data, field_name)
-        elif chart_type == 'polar':
-            return PatternChartService._generate_polar_chart(pattern_data, field_name)
-        elif chart_type == 'bar':
-            return PatternChartService._generate_bar_chart(pattern_data, field_name)
-        else:  # 'heatmap' (default)
-            return PatternChartService._generate_heatmap_chart(pattern_data, field_name)
+        key = _chart_cache_key(pattern_data, field_name, chart_type, image_format)
+        if key is not None:
+            image = _cached_chart(key)
+            if image is not None:
+                return image
+        
+        # Unknown chart types fall back to the heatmap (default)
+        handler = _CHART_HANDLERS.get(chart_type, PatternChartService._generate_heatmap_chart)
+        image = handler(pattern_data, field_name, image_format)
+        
+        if key is not None:
+            _store_chart(key, image)
+        return image
     
     @staticmethod
-    def _generate_heatmap_chart(
+    def generate_pattern_charts_bulk(
         pattern_data: Dict[str, Any],
-        field_name: str
-    ) -> bytes:
-        """Generate day-of-week pattern heatmap."""
+        tracker_id: int,
+        field_name: str,
+        chart_types: List[str],
+        months: int = 3,
+        image_format: str = 'png'
+    ) -> Dict[str, bytes]:
+        """
+        Generate several chart types for the same pattern data in parallel.
         
-        # Get patterns dictionary
-        patterns = pattern_data.get('patterns', {})
-        day_of_week_pattern = patterns.get('day_of_week')
+        Each worker thread renders on its own pooled figures, and Agg drawing
+        and image encoding release the GIL for much of their work.
         
-        if not day_of_week_pattern:
-            return PatternChartService._generate_no_data_chart(
-                "No day-of-week patterns found"
-            )
+        Args:
+            pattern_data: Pattern data from PatternRecognitionService
+            tracker_id: Tracker ID
+            field_name: Field being analyzed
+            chart_types: Chart types to render (see generate_pattern_chart)
+            months: Number of months analyzed
+            image_format: Output format ('png', 'webp', 'jpeg')
         
-        # Ensure day_of_week_pattern is a dictionary
-        if not isinstance(day_of_week_pattern, dict):
-            return PatternChartService._generate_no_data_chart(
-                f"Invalid pattern format: expected dict, got {type(day_of_week_pattern).__name__}"
+        Returns:
+            Dict mapping each requested chart type to its image bytes
+        """
+        chart_types = list(dict.fromkeys(chart_types))
+        if len(chart_types) <= 1:
+            return {
+                chart_type: PatternChartService.generate_pattern_chart(
+                    pattern_data, tracker_id, field_name, chart_type, months, image_format
+                )
+                for chart_type in chart_types
+            }
+        
+        def render(chart_type: str) -> Tuple[str, bytes]:
+            return chart_type, PatternChartService.generate_pattern_chart(
+                pattern_data, tracker_id, field_name, chart_type, months, image_format
             )
         
-        # Prepare data for heatmap
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        return dict(_bulk_pool.map(render, chart_types))
+    
+    @staticmethod
+    def _extract_day_series(
+        day_of_week_pattern: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Extract per-weekday (values, confidences) from a day-of-week pattern.
         
-        # Extract pattern data based on field type
-        day_data = {}
+        Numeric patterns use day_statistics means; categorical patterns use
+        consistent_patterns (list) or, failing that, day_patterns (dict).
+        The flag reports whether any weekday was filled.
         
-        pattern_type = day_of_week_pattern.get('type', 'numeric')  # Default to numeric if not specified
-        if pattern_type == 'numeric':
+        Raises:
+            ValueError: With a displayable message if the pattern data is malformed
+        """
+        days = _DAYS
+        values = np.zeros(len(days))
+        confidences = np.zeros(len(days))
+        has_day_data = False
+        
+        if day_of_week_pattern.get('type', 'numeric') == 'numeric':
             # Numeric field - use day_statistics
             day_stats = day_of_week_pattern.get('day_statistics', {})
-            if not isinstance(day_stats, dict):
-                return PatternChartService._generate_no_data_chart(
-                    "Invalid day statistics format"
-                )
+            if type(day_stats) is not dict:
+                raise ValueError("Invalid day statistics format")
             
             for dow, stats in day_stats.items():
                 # Ensure stats is a dictionary
-                if not isinstance(stats, dict):
+                if type(stats) is not dict:
                     continue
                 
                 day_name = stats.get('day', '')
                 if not day_name and isinstance(dow, int) and 0 <= dow < len(days):
                     day_name = days[dow]
                 
-                if day_name and day_name in days:
-                    day_data[day_name] = {
-                        'value': float(stats.get('mean', 0)),
-                        'confidence': 0.7 if day_of_week_pattern.get('confidence') == 'high' else 0.5
-                    }
+                idx = _DAY_IDX.get(day_name)
+                if idx is not None:
+                    values[idx] = float(stats.get('mean', 0))
+                    confidences[idx] = 0.7 if day_of_week_pattern.get('confidence') == 'high' else 0.5
+                    has_day_data = True
         else:
             # Categorical field - use day_patterns (dict) or consistent_patterns (list)
             day_patterns_dict = day_of_week_pattern.get('day_patterns', {})
             consistent_patterns = day_of_week_pattern.get('consistent_patterns', [])
             
             # Try consistent_patterns first (list format)
-            if isinstance(consistent_patterns, list) and consistent_patterns:
+            if type(consistent_patterns) is list and consistent_patterns:
                 for pattern in consistent_patterns:
-                    if not isinstance(pattern, dict):
+                    if type(pattern) is not dict:
                         continue
                     
                     day = pattern.get('day', '')
-                    count_str = pattern.get('frequency', '0/0')
-                    # Parse frequency like "5/10" to get count
-                    try:
-                        count = int(count_str.split('/')[0]) if '/' in count_str else pattern.get('count', 0)
-                    except:
-                        count = pattern.get('count', 0)
+                    count = _parse_frequency(pattern)
                     
                     consistency = pattern.get('consistency', 0)
                     # Convert percentage to decimal if needed
                     if isinstance(consistency, (int, float)) and consistency > 1:
                         consistency = consistency / 100.0
                     
-                    if day and day in days:
-                        day_data[day] = {
-                            'value': float(count),
-                            'confidence': float(consistency) if isinstance(consistency, (int, float)) else 0.0
-                        }
+                    idx = _DAY_IDX.get(day)
+                    if idx is not None:
+                        values[idx] = float(count)
+                        confidences[idx] = float(consistency) if isinstance(consistency, (int, float)) else 0.0
+                        has_day_data = True
             # Fallback to day_patterns dict
-            elif isinstance(day_patterns_dict, dict) and day_patterns_dict:
+            elif type(day_patterns_dict) is dict and day_patterns_dict:
                 for dow, pattern in day_patterns_dict.items():
-                    if not isinstance(pattern, dict):
+                    if type(pattern) is not dict:
                         continue
                     
                     day = pattern.get('day', '')
@@ -156,52 +425,81 @@ class PatternChartService:
                     # Calculate consistency from frequency
                     frequency = pattern.get('frequency', {})
                     most_common = pattern.get('most_common', '')
-                    if isinstance(frequency, dict) and most_common:
+                    if type(frequency) is dict and most_common:
                         mode_count = frequency.get(most_common, 0)
                         consistency = mode_count / count if count > 0 else 0
                     else:
                         consistency = 0.5  # Default
                     
-                    if day and day in days:
-                        day_data[day] = {
-                            'value': float(count),
-                            'confidence': float(consistency)
-                        }
+                    idx = _DAY_IDX.get(day)
+                    if idx is not None:
+                        values[idx] = float(count)
+                        confidences[idx] = float(consistency)
+                        has_day_data = True
             else:
-                return PatternChartService._generate_no_data_chart(
-                    "No day-of-week pattern data available"
-                )
+                raise ValueError("No day-of-week pattern data available")
+        
+        return values, confidences, has_day_data
+    
+    @staticmethod
+    def _generate_heatmap_chart(
+        pattern_data: Dict[str, Any],
+        field_name: str,
+        image_format: str = 'png'
+    ) -> bytes:
+        """Generate day-of-week pattern heatmap."""
+        
+        # Get patterns dictionary
+        patterns = pattern_data.get('patterns', {})
+        day_of_week_pattern = patterns.get('day_of_week')
+        
+        if not day_of_week_pattern:
+            return PatternChartService._generate_no_data_chart(
+                "No day-of-week patterns found",
+                image_format
+            )
+        
+        # Ensure day_of_week_pattern is a dictionary
+        if type(day_of_week_pattern) is not dict:
+            return PatternChartService._generate_no_data_chart(
+                f"Invalid pattern format: expected dict, got {type(day_of_week_pattern).__name__}",
+                image_format
+            )
+        
+        days = _DAYS
+        pattern_type = day_of_week_pattern.get('type', 'numeric')  # Default to numeric if not specified
+        
+        try:
+            values, confidences, has_day_data = PatternChartService._extract_day_series(
+                day_of_week_pattern
+            )
+        except ValueError as e:
+            return PatternChartService._generate_no_data_chart(str(e), image_format)
         
         # Check if we have any data
-        if not day_data:
+        if not has_day_data:
             return PatternChartService._generate_no_data_chart(
                 f"No day-of-week data extracted. Pattern type: {pattern_type}, "
                 f"Has day_statistics: {'day_statistics' in day_of_week_pattern}, "
-                f"Has day_patterns: {'day_patterns' in day_of_week_pattern}"
+                f"Has day_patterns: {'day_patterns' in day_of_week_pattern}",
+                image_format
             )
         
-        # Create matrix (1 row x 7 columns)
-        values = [day_data.get(day, {}).get('value', 0) for day in days]
-        confidences = [day_data.get(day, {}).get('confidence', 0) for day in days]
-        
-        # Find highest and lowest days for annotations
-        if values:
-            max_val = max(values)
-            min_val = min(values)
-            max_day_idx = values.index(max_val)
-            min_day_idx = values.index(min_val)
-            max_day = days[max_day_idx]
-            min_day = days[min_day_idx]
-        else:
-            max_day = min_day = None
+        # Find highest and lowest days for annotations (first day wins ties)
+        max_day_idx = int(values.argmax())
+        min_day_idx = int(values.argmin())
+        max_val = values[max_day_idx]
+        min_val = values[min_day_idx]
+        max_day = days[max_day_idx]
+        min_day = days[min_day_idx]
         
         # Create figure with more space
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 8), 
-                                       gridspec_kw={'height_ratios': [3, 1]})
+        fig, (ax1, ax2) = _acquire_figure('heatmap', (14, 8), nrows=2, ncols=1,
+                                          gridspec_kw={'height_ratios': [3, 1]})
         
-        # Main heatmap
-        values_2d = np.array([values])
-        im = ax1.imshow(values_2d, cmap='RdYlGn', aspect='auto', vmin=min(values) if values else 0, vmax=max(values) if values else 10)
+        # Main heatmap (1 row x 7 columns)
+        values_2d = values[np.newaxis, :]
+        im = ax1.imshow(values_2d, cmap='RdYlGn', aspect='auto', vmin=min_val, vmax=max_val)
         
         # Set ticks
         ax1.set_xticks(range(len(days)))
@@ -209,28 +507,32 @@ class PatternChartService:
         ax1.set_yticks([])
         
         # Add value labels with annotations
-        avg_val = np.mean(values) if values else 0
-        for i, (day, val, conf) in enumerate(zip(days, values, confidences)):
+        avg_val = values.mean()
+        value_list = values.tolist()
+        confidence_list = confidences.tolist()
+        for i in range(len(days)):
+            val = value_list[i]
+            conf = confidence_list[i]
             text_color = 'white' if val > avg_val else 'black'
             
             # Add day label with value
-            label_text = f'{day}\n{val:.1f}'
+            label_text = f'{days[i]}\n{val:.1f}'
             if conf > 0.6:
                 label_text += f'\n✓ High confidence'
             
             ax1.text(i, 0, label_text, 
                     ha='center', va='center', color=text_color, fontsize=11, fontweight='bold',
-                    bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.3, edgecolor='black', linewidth=1))
+                    bbox=_HEATMAP_CELL_BBOX)
         
         # Add pattern insights
         title = f'Weekly Pattern: {field_name.replace(".", " ").title()}'
-        if max_day and min_day and max_val != min_val:
+        if max_val != min_val:
             title += f'\nHighest on {max_day} ({max_val:.1f}), Lowest on {min_day} ({min_val:.1f})'
         
         ax1.set_title(title, fontsize=15, fontweight='bold', pad=15)
         
         # Colorbar with label
-        cbar = plt.colorbar(im, ax=ax1, orientation='horizontal', pad=0.1)
+        cbar = fig.colorbar(im, ax=ax1, orientation='horizontal', pad=0.1)
         cbar.set_label('Value', fontsize=11, fontweight='bold')
         
         # Confidence bar chart with annotations
@@ -242,9 +544,10 @@ class PatternChartService:
         ax2.axhline(y=0.6, color='r', linestyle='--', linewidth=2, alpha=0.7, label='Reliability Threshold')
         
         # Add confidence labels on bars
-        for i, (bar, conf) in enumerate(zip(bars, confidences)):
+        for i in range(len(bars)):
+            bar = bars[i]
             height = bar.get_height()
-            if conf > 0.6:
+            if confidence_list[i] > 0.6:
                 label = '✓ Reliable'
                 color = '#4CAF50'
             else:
@@ -264,22 +567,18 @@ class PatternChartService:
             if insight:
                 ax1.text(0.02, 0.98, f"💡 {insight}", transform=ax1.transAxes,
                         fontsize=10, verticalalignment='top',
-                        bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8, edgecolor='orange', linewidth=2))
+                        bbox=_INSIGHT_BBOX)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        plt.close(fig)
-        
-        return buffer.getvalue()
+        return _figure_bytes(fig, image_format)
     
     @staticmethod
     def _generate_bar_chart(
         pattern_data: Dict[str, Any],
-        field_name: str
+        field_name: str,
+        image_format: str = 'png'
     ) -> bytes:
         """Generate bar chart showing pattern frequencies."""
         
@@ -308,16 +607,12 @@ class PatternChartService:
                 consistent_patterns = dow_pattern.get('consistent_patterns', [])
                 
                 # Try consistent_patterns first (list format)
-                if isinstance(consistent_patterns, list) and consistent_patterns:
+                if type(consistent_patterns) is list and consistent_patterns:
                     for pattern in consistent_patterns:
-                        if isinstance(pattern, dict):
+                        if type(pattern) is dict:
                             day = pattern.get('day', '')
                             most_common = pattern.get('value', pattern.get('most_common', ''))
-                            count_str = pattern.get('frequency', '0/0')
-                            try:
-                                count = int(count_str.split('/')[0]) if '/' in count_str else pattern.get('count', 0)
-                            except:
-                                count = pattern.get('count', 0)
+                            count = _parse_frequency(pattern)
                             
                             consistency = pattern.get('consistency', 0)
                             if isinstance(consistency, (int, float)) and consistency > 1:
@@ -330,16 +625,16 @@ class PatternChartService:
                                 'confidence': float(consistency) if isinstance(consistency, (int, float)) else 0.0
                             })
                 # Fallback to day_patterns dict
-                elif isinstance(day_patterns_dict, dict) and day_patterns_dict:
+                elif type(day_patterns_dict) is dict and day_patterns_dict:
                     for dow, pattern in day_patterns_dict.items():
-                        if isinstance(pattern, dict):
+                        if type(pattern) is dict:
                             day = pattern.get('day', '')
                             most_common = pattern.get('most_common', '')
                             count = pattern.get('count', 0)
                             
                             # Calculate consistency
                             frequency = pattern.get('frequency', {})
-                            if isinstance(frequency, dict) and most_common:
+                            if type(frequency) is dict and most_common:
                                 mode_count = frequency.get(most_common, 0)
                                 consistency = mode_count / count if count > 0 else 0
                             else:
@@ -354,11 +649,11 @@ class PatternChartService:
         
         # Time-of-month patterns
         month_pattern = patterns.get('time_of_month')
-        if month_pattern and isinstance(month_pattern, dict):
+        if month_pattern and type(month_pattern) is dict:
             periods = month_pattern.get('period_statistics', {})
-            if isinstance(periods, dict):
+            if type(periods) is dict:
                 for period, stats in periods.items():
-                    if isinstance(stats, dict):
+                    if type(stats) is dict:
                         all_patterns.append({
                             'type': 'Time of Month',
                             'label': period.replace('_', ' ').title(),
@@ -368,11 +663,11 @@ class PatternChartService:
         
         # Streak patterns
         streak_pattern = patterns.get('streaks')
-        if streak_pattern and isinstance(streak_pattern, dict):
+        if streak_pattern and type(streak_pattern) is dict:
             streaks = streak_pattern.get('streaks', [])
-            if isinstance(streaks, list):
+            if type(streaks) is list:
                 for streak in streaks:
-                    if isinstance(streak, dict):
+                    if type(streak) is dict:
                         all_patterns.append({
                             'type': 'Streak',
                             'label': f"{streak.get('value', '')} ({streak.get('length', 0)} days)",
@@ -382,7 +677,8 @@ class PatternChartService:
         
         if not all_patterns:
             return PatternChartService._generate_no_data_chart(
-                "No patterns to visualize"
+                "No patterns to visualize",
+                image_format
             )
         
         # Sort by confidence
@@ -390,7 +686,7 @@ class PatternChartService:
         all_patterns = all_patterns[:10]  # Top 10
         
         # Create figure with more space
-        fig, ax = plt.subplots(figsize=(14, max(8, len(all_patterns) * 0.8)))
+        fig, ax = _acquire_figure('bar', (14, max(8, len(all_patterns) * 0.8)))
         
         # Prepare data with better labels
         labels = []
@@ -399,27 +695,12 @@ class PatternChartService:
         annotations = []
         
         for p in all_patterns:
-            pattern_type = p['type']
-            pattern_label = p['label']
             conf = p['confidence']
-            value = p['value']
             
             # Create user-friendly label
-            if pattern_type == 'Day of Week':
-                labels.append(f"📅 {pattern_label}")
-                if conf >= 0.7:
-                    annotations.append(f"Strong weekly pattern (observed {value:.0f} times)")
-                else:
-                    annotations.append(f"Weekly trend (confidence: {conf:.0%})")
-            elif pattern_type == 'Time of Month':
-                labels.append(f"📆 {pattern_label}")
-                annotations.append(f"Monthly pattern (avg: {value:.1f})")
-            elif pattern_type == 'Streak':
-                labels.append(f"🔥 {pattern_label}")
-                annotations.append(f"Consecutive pattern (length: {value} days)")
-            else:
-                labels.append(f"{pattern_type}: {pattern_label}")
-                annotations.append(f"Confidence: {conf:.0%}")
+            label_fmt, strong_fmt, weak_fmt = _BAR_TEXT_FORMATS.get(p['type'], _BAR_TEXT_DEFAULT)
+            labels.append(label_fmt.format(**p))
+            annotations.append((strong_fmt if conf >= 0.7 else weak_fmt).format(**p))
             
             confidences.append(conf)
             
@@ -436,17 +717,17 @@ class PatternChartService:
         bars = ax.barh(y_pos, confidences, color=colors, alpha=0.7, edgecolor='black', linewidth=1.5)
         
         # Add confidence percentage labels
-        for i, (bar, conf) in enumerate(zip(bars, confidences)):
-            width = bar.get_width()
-            ax.text(width + 0.02, i, f'{conf:.0%}', 
+        for i in range(len(bars)):
+            width = bars[i].get_width()
+            ax.text(width + 0.02, i, f'{confidences[i]:.0%}', 
                    va='center', fontsize=11, fontweight='bold')
         
         # Add detailed annotations
         max_conf = max(confidences) if confidences else 1.0
-        for i, (annotation, conf) in enumerate(zip(annotations, confidences)):
-            ax.text(max_conf * 1.15, i, annotation, 
+        for i in range(len(annotations)):
+            ax.text(max_conf * 1.15, i, annotations[i], 
                    va='center', fontsize=10, style='italic',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.8, edgecolor=colors[i], linewidth=1.5))
+                   bbox=_BAR_ANNOTATION_BBOXES[colors[i]])
         
         # Customize
         ax.set_yticks(y_pos)
@@ -475,22 +756,18 @@ class PatternChartService:
             summary = f"Overall Pattern Strength: {overall.title()}"
             ax.text(0.98, 0.02, summary, transform=ax.transAxes,
                    fontsize=10, horizontalalignment='right', fontweight='bold',
-                   bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
+                   bbox=_SUMMARY_BBOX)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        plt.close(fig)
-        
-        return buffer.getvalue()
+        return _figure_bytes(fig, image_format)
     
     @staticmethod
     def _generate_polar_chart(
         pattern_data: Dict[str, Any],
-        field_name: str
+        field_name: str,
+        image_format: str = 'png'
     ) -> bytes:
         """Generate polar/radar chart for cyclical patterns."""
         
@@ -500,109 +777,56 @@ class PatternChartService:
         
         if not day_of_week_pattern:
             return PatternChartService._generate_no_data_chart(
-                "No cyclical patterns found"
+                "No cyclical patterns found",
+                image_format
             )
         
-        # Prepare data
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        # Ensure day_of_week_pattern is a dictionary
+        if type(day_of_week_pattern) is not dict:
+            return PatternChartService._generate_no_data_chart(
+                f"Invalid pattern format: expected dict, got {type(day_of_week_pattern).__name__}",
+                image_format
+            )
         
-        if day_of_week_pattern.get('type') == 'numeric':
-            # Numeric field - use day_statistics
-            day_stats = day_of_week_pattern.get('day_statistics', {})
-            if not isinstance(day_stats, dict):
-                return PatternChartService._generate_no_data_chart(
-                    "Invalid day statistics format"
-                )
-            
-            day_data = {}
-            for dow, stats in day_stats.items():
-                # Ensure stats is a dictionary
-                if not isinstance(stats, dict):
-                    continue
-                
-                day_name = stats.get('day', '')
-                if not day_name and isinstance(dow, int) and 0 <= dow < len(days):
-                    day_name = days[dow]
-                
-                if day_name:
-                    day_data[day_name] = float(stats.get('mean', 0))
-        else:
-            # Categorical field - use day_patterns (dict) or consistent_patterns (list)
-            day_patterns_dict = day_of_week_pattern.get('day_patterns', {})
-            consistent_patterns = day_of_week_pattern.get('consistent_patterns', [])
-            
-            day_data = {}
-            
-            # Try consistent_patterns first (list format)
-            if isinstance(consistent_patterns, list) and consistent_patterns:
-                for pattern in consistent_patterns:
-                    if not isinstance(pattern, dict):
-                        continue
-                    
-                    day = pattern.get('day', '')
-                    count_str = pattern.get('frequency', '0/0')
-                    try:
-                        count = int(count_str.split('/')[0]) if '/' in count_str else pattern.get('count', 0)
-                    except:
-                        count = pattern.get('count', 0)
-                    
-                    if day:
-                        day_data[day] = float(count)
-            # Fallback to day_patterns dict
-            elif isinstance(day_patterns_dict, dict) and day_patterns_dict:
-                for dow, pattern in day_patterns_dict.items():
-                    if not isinstance(pattern, dict):
-                        continue
-                    
-                    day = pattern.get('day', '')
-                    if not day and isinstance(dow, int) and 0 <= dow < len(days):
-                        day = days[dow]
-                    
-                    count = pattern.get('count', 0)
-                    if day:
-                        day_data[day] = float(count)
-            
-            if not day_data:
-                return PatternChartService._generate_no_data_chart(
-                    "No day-of-week pattern data available"
-                )
+        try:
+            values, _, has_day_data = PatternChartService._extract_day_series(
+                day_of_week_pattern
+            )
+        except ValueError as e:
+            return PatternChartService._generate_no_data_chart(str(e), image_format)
         
-        values = [float(day_data.get(day, 0)) for day in days]
+        if not has_day_data:
+            return PatternChartService._generate_no_data_chart(
+                "No day-of-week pattern data available",
+                image_format
+            )
         
-        # Create polar plot
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+        # Reuse the prebuilt wheel: only the data, title and radial scale change
+        fig, ax, line, area = _acquire_polar_frame()
         
-        # Angles for each day
-        angles = np.linspace(0, 2 * np.pi, len(days), endpoint=False).tolist()
-        values += values[:1]  # Complete the circle
-        angles += angles[:1]
+        # Complete the circle
+        values_closed = np.empty(len(_POLAR_ANGLES))
+        values_closed[:-1] = values
+        values_closed[-1] = values[0]
         
-        # Plot
-        ax.plot(angles, values, 'o-', linewidth=2, color='#2196F3', label='Average Value')
-        ax.fill(angles, values, alpha=0.25, color='#2196F3')
+        line.set_ydata(values_closed)
+        area.set_xy(np.column_stack((_POLAR_ANGLES, values_closed)))
+        ax.relim()
+        ax.autoscale_view()
         
-        # Set labels
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(days)
         ax.set_title(f'Weekly Pattern Cycle: {field_name.replace(".", " ").title()}', 
                     fontsize=14, fontweight='bold', pad=20)
-        ax.grid(True)
-        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        plt.close(fig)
-        
-        return buffer.getvalue()
+        return _figure_bytes(fig, image_format)
     
     @staticmethod
     def _generate_calendar_chart(
         pattern_data: Dict[str, Any],
-        field_name: str
+        field_name: str,
+        image_format: str = 'png'
     ) -> bytes:
         """Generate calendar-style visualization."""
         
@@ -612,24 +836,22 @@ class PatternChartService:
         
         if not month_pattern:
             return PatternChartService._generate_no_data_chart(
-                "No time-of-month patterns for calendar view"
+                "No time-of-month patterns for calendar view",
+                image_format
             )
         
-        # Create a 4x1 grid for month periods
-        periods = ['early_month', 'mid_month', 'late_month', 'end_of_month']
-        period_labels = ['Early', 'Mid', 'Late', 'End']
-        
         period_stats = month_pattern.get('period_statistics', {})
-        if not isinstance(period_stats, dict):
+        if type(period_stats) is not dict:
             return PatternChartService._generate_no_data_chart(
-                "Invalid period statistics format"
+                "Invalid period statistics format",
+                image_format
             )
         
         values = []
-        for period in periods:
+        for period in _PERIODS:
             if period in period_stats:
                 stats = period_stats[period]
-                if isinstance(stats, dict):
+                if type(stats) is dict:
                     values.append(float(stats.get('mean', stats.get('count', 0))))
                 elif isinstance(stats, (int, float)):
                     values.append(float(stats))
@@ -639,49 +861,38 @@ class PatternChartService:
                 values.append(0.0)
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(12, 4))
+        fig, ax = _acquire_figure('calendar', (12, 4))
         
-        # Create horizontal bar-like visualization
-        colors = plt.cm.RdYlGn(np.linspace(0.3, 0.9, 4))
-        bars = ax.barh(range(4), values, color=colors, alpha=0.7)
+        # Create horizontal bar-like visualization (4x1 grid of month periods)
+        ax.barh(range(4), values, color=_PERIOD_COLORS, alpha=0.7)
         
         # Add labels
         ax.set_yticks(range(4))
-        ax.set_yticklabels(period_labels)
+        ax.set_yticklabels(_PERIOD_LABELS)
         ax.set_xlabel('Average Value')
         ax.set_title(f'Monthly Pattern: {field_name.replace(".", " ").title()}', 
                     fontsize=14, fontweight='bold')
         ax.grid(axis='x', alpha=0.3)
         
         # Add value labels
-        for i, (bar, val) in enumerate(zip(bars, values)):
+        for i, val in enumerate(values):
             ax.text(val + 0.1, i, f'{val:.1f}', va='center')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        plt.close(fig)
-        
-        return buffer.getvalue()
+        return _figure_bytes(fig, image_format)
     
     @staticmethod
-    def _generate_no_data_chart(message: str) -> bytes:
+    def _generate_no_data_chart(message: str, image_format: str = 'png') -> bytes:
         """Generate a placeholder chart when no data is available."""
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.text(0.5, 0.5, message, 
-                horizontalalignment='center',
-                verticalalignment='center',
-                fontsize=14, color='gray',
-                transform=ax.transAxes)
-        ax.axis('off')
-        
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-        buffer.seek(0)
-        plt.close(fig)
-        
-        return buffer.getvalue()
+        return _no_data_image(str(message), image_format)
+
 
+# Chart generator per chart_type (defined after the class so the methods exist)
+_CHART_HANDLERS = {
+    'calendar': PatternChartService._generate_calendar_chart,
+    'polar': PatternChartService._generate_polar_chart,
+    'bar': PatternChartService._generate_bar_chart,
+    'heatmap': PatternChartService._generate_heatmap_chart,
+}
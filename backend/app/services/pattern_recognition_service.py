@@ -8,25 +8,136 @@ Supports:
 - Period trackers: Cycle-based patterns + temporal patterns
 """
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import date, timedelta, datetime
 from collections import defaultdict, Counter
 import numpy as np
 from scipy import stats
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, load_only
 
+from app import db
 from app.models.tracking_data import TrackingData
 from app.models.tracker import Tracker
-from app.models.tracker_category import TrackerCategory
 from app.models.period_cycle import PeriodCycle
 from app.services.analytics_base import (
     AnalyticsDataExtractor,
     AnalyticsGrouper,
-    AnalyticsStatsCalculator,
     FieldTypeDetector
 )
 from app.services.period_cycle_service import PeriodCycleService
 
 
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_DAY_SHORT_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Cycle phases in cycle order; detectors index this with their phase ids
+_PHASE_NAMES = ('menstruation', 'follicular', 'ovulation', 'luteal')
+
+# Shared pool for running the independent pattern detectors of one request
+# side by side; they only compute on ExtractedColumns (no database access)
+_DETECTOR_MAX_WORKERS = 4
+_detector_pool = ThreadPoolExecutor(
+    max_workers=_DETECTOR_MAX_WORKERS, thread_name_prefix='pattern-detector'
+)
+
+# Below this many entries a plain Python scan finds runs faster than the
+# vectorized diff, whose fixed per-call overhead dominates short masks
+_VECTOR_RUN_SCAN_MIN = 100
+
+_MONTH_PERIOD_LABELS = {
+    'early': 'Early Month (1-10)',
+    'mid': 'Mid Month (11-20)',
+    'late': 'Late Month (21-31)'
+}
+
+# How each phase reads in insights: "peaks during <label>" for numeric fields,
+# "is typically 'x' <label>" for categorical ones, and "<label>" as the timing
+# of recurring cycle patterns
+_PHASE_LABELS_NUMERIC = {
+    'menstruation': 'menstrual phase',
+    'follicular': 'follicular phase',
+    'ovulation': 'ovulation',
+    'luteal': 'luteal phase'
+}
+_PHASE_LABELS_CATEGORICAL = {
+    'menstruation': 'when period ends',
+    'follicular': 'in follicular phase',
+    'ovulation': 'during ovulation',
+    'luteal': 'in luteal phase'
+}
+_PHASE_TIMINGS = {
+    'menstruation': 'during your period',
+    'follicular': 'in follicular phase',
+    'ovulation': 'during ovulation',
+    'luteal': 'in luteal phase'
+}
+
+# Recurring categorical period-end timings, by days after the period ends
+_PERIOD_END_TIMINGS = {
+    0: "right when period ends",
+    1: "1 day after period ends",
+    2: "2 days after period ends",
+    3: "3 days after period ends"
+}
+
+
+@dataclass
+class ExtractedColumns:
+    """
+    Extracted entries as parallel columns, one row per entry with a value.
+    
+    Rows keep the extractor's order, which is entry_date ascending - the
+    streak scan relies on that rather than re-sorting.
+    """
+    dates: np.ndarray           # datetime64[D]
+    values: np.ndarray          # float64 for numeric fields, object otherwise
+    dows: np.ndarray            # 0=Monday, 6=Sunday
+    days_of_month: np.ndarray   # 1-31
+    
+    @classmethod
+    def from_extracted(cls, data: List[Dict], field_type: str) -> 'ExtractedColumns':
+        """
+        Convert AnalyticsDataExtractor rows into columns.
+        
+        Entries without a value are dropped here, once, so the detectors
+        working on the columns never check for None.
+        """
+        present = [item for item in data if item['value'] is not None]
+        
+        dates = np.array([item['entry_date'] for item in present], dtype='datetime64[D]')
+        values = np.fromiter(
+            (item['value'] for item in present),
+            dtype=np.float64 if field_type == 'numeric' else object,
+            count=len(present)
+        )
+        
+        # The datetime64 epoch (1970-01-01) was a Thursday, hence the +3
+        dows = (dates.view('i8') + 3) % 7
+        days_of_month = (dates - dates.astype('datetime64[M]')).astype(np.intp) + 1
+        
+        return cls(dates=dates, values=values, dows=dows, days_of_month=days_of_month)
+
+
+@dataclass
+class CycleColumns:
+    """
+    One cycle's entries annotated with cycle timing, as parallel columns in
+    entry_date order.
+    """
+    cycle_id: int
+    values: np.ndarray                  # float64 for numeric fields, object otherwise
+    dates: np.ndarray                   # datetime64[D]
+    cycle_days: np.ndarray              # 1 = cycle start day
+    phase_ids: np.ndarray               # index into _PHASE_NAMES
+    phase_days: np.ndarray              # 1 = first day of the phase
+    days_after_period_end: np.ndarray   # negative before the period ends
+
+
 class PatternRecognitionService:
     """
     Detects and analyzes patterns in tracking data.
@@ -42,6 +153,7 @@ class PatternRecognitionService:
     # Minimum occurrences to consider a pattern valid
     MIN_PATTERN_OCCURRENCES = 2
     MIN_CONFIDENCE_THRESHOLD = 0.6  # 60% consistency
+    MIN_DATA_POINTS = 10  # Entries with a value needed before detecting anything
     
     @staticmethod
     def detect_all_patterns(
@@ -57,27 +169,68 @@ class PatternRecognitionService:
         Returns:
             Dictionary with detected patterns and insights
         """
-        tracker = Tracker.query.get(tracker_id)
+        cutoff_date = date.today() - timedelta(days=months * 30)
+        entry_count = db.session.query(
+            func.count(TrackingData.id)
+        ).filter(
+            TrackingData.tracker_id == tracker_id,
+            TrackingData.entry_date >= cutoff_date
+        ).scalar()
+        
+        return PatternRecognitionService._detect_patterns_in_window(
+            tracker_id, field_name, option, min_confidence, cutoff_date, entry_count
+        )
+    
+    @staticmethod
+    def _detect_patterns_in_window(
+        tracker_id: int,
+        field_name: str,
+        option: Optional[str],
+        min_confidence: float,
+        cutoff_date: date,
+        entry_count: int
+    ) -> Dict[str, Any]:
+        """
+        Run every pattern detector for a field over entries since cutoff_date.
+        
+        entry_count is the number of entries in that window; when it is already
+        below MIN_DATA_POINTS the entries are not loaded or parsed at all, and
+        the response reports it as entries_in_window (data_points is only
+        given once the field's values have been extracted).
+        """
+        # Tracker and its category in one query
+        tracker = Tracker.query.options(joinedload(Tracker.category)).get(tracker_id)
         if not tracker:
             raise ValueError(f"Tracker {tracker_id} not found")
         
-        category = TrackerCategory.query.filter_by(id=tracker.category_id).first()
+        # Too few rows to hold enough values for any field. data_points means
+        # extracted values of this field, which are not counted here, so the
+        # row count is reported under its own key
+        if entry_count < PatternRecognitionService.MIN_DATA_POINTS:
+            return {
+                'message': 'Need at least 10 data points to detect patterns',
+                'entries_in_window': entry_count
+            }
+        
+        category = tracker.category
         is_period_tracker = category and category.name == 'Period Tracker'
         
-        # Get tracking data
-        cutoff_date = date.today() - timedelta(days=months * 30)
+        # Get tracking data - a range scan on idx_tracker_entry_date, loading only
+        # the columns extraction reads and streaming rows in batches
         entries = TrackingData.query.filter_by(
             tracker_id=tracker_id
         ).filter(
             TrackingData.entry_date >= cutoff_date
-        ).order_by(TrackingData.entry_date.asc()).all()
+        ).options(
+            load_only(TrackingData.entry_date, TrackingData.data)
+        ).order_by(TrackingData.entry_date.asc()).yield_per(1000)
         
         # Extract field values
         extracted_data = AnalyticsDataExtractor.extract_field_values(
             entries, field_name, option, tracker_id
         )
         
-        if not extracted_data or len(extracted_data) < 10:
+        if not extracted_data or len(extracted_data) < PatternRecognitionService.MIN_DATA_POINTS:
             return {
                 'message': 'Need at least 10 data points to detect patterns',
                 'data_points': len(extracted_data) if extracted_data else 0
@@ -101,34 +254,48 @@ class PatternRecognitionService:
             'patterns': {}
         }
         
+        # Columnar view shared by all detectors
+        columns = ExtractedColumns.from_extracted(extracted_data, field_type)
+        
+        # The detectors are independent, so they run concurrently on the shared
+        # pool. Futures are kept in the order below and collected in that order
+        # so the patterns (and the insights built from them) keep a stable order.
+        detectors = {}
+        
         # 1. Day-of-week patterns (all trackers)
-        dow_patterns = PatternRecognitionService._detect_day_of_week_patterns(
-            extracted_data, field_name, field_type, min_confidence
+        detectors['day_of_week'] = _detector_pool.submit(
+            PatternRecognitionService._detect_day_of_week_patterns,
+            columns, field_name, field_type, min_confidence
         )
-        if dow_patterns:
-            detected_patterns['patterns']['day_of_week'] = dow_patterns
         
         # 2. Time-of-month patterns (all trackers)
-        month_patterns = PatternRecognitionService._detect_time_of_month_patterns(
-            extracted_data, field_name, field_type, min_confidence
+        detectors['time_of_month'] = _detector_pool.submit(
+            PatternRecognitionService._detect_time_of_month_patterns,
+            columns, field_name, field_type, min_confidence
         )
-        if month_patterns:
-            detected_patterns['patterns']['time_of_month'] = month_patterns
         
-        # 3. Cycle-specific patterns (period tracker only)
+        # 3. Cycle-specific patterns (period tracker only). Settings and cycles
+        # are read here, in the request's app context, not in the worker.
         if is_period_tracker:
-            cycle_patterns = PatternRecognitionService._detect_cycle_phase_patterns(
-                tracker_id, extracted_data, field_name, field_type, min_confidence
+            settings = PeriodCycleService.get_tracker_settings(tracker_id)
+            cycle_starts = [
+                cycle.cycle_start_date for cycle in PeriodCycleService.get_all_cycles(tracker_id)
+            ]
+            detectors['cycle_phases'] = _detector_pool.submit(
+                PatternRecognitionService._detect_cycle_phase_patterns,
+                settings, cycle_starts, columns, field_name, field_type, min_confidence
             )
-            if cycle_patterns:
-                detected_patterns['patterns']['cycle_phases'] = cycle_patterns
         
         # 4. Streak patterns (consecutive days)
-        streak_patterns = PatternRecognitionService._detect_streak_patterns(
-            extracted_data, field_name, field_type
+        detectors['streaks'] = _detector_pool.submit(
+            PatternRecognitionService._detect_streak_patterns,
+            columns, field_name, field_type
         )
-        if streak_patterns:
-            detected_patterns['patterns']['streaks'] = streak_patterns
+        
+        for pattern_type, detector in detectors.items():
+            pattern = detector.result()
+            if pattern:
+                detected_patterns['patterns'][pattern_type] = pattern
         
         # Generate insights from all patterns
         detected_patterns['insights'] = PatternRecognitionService._generate_pattern_insights(
@@ -304,8 +471,6 @@ class PatternRecognitionService:
     ) -> List[Dict[str, Any]]:
         """Build frontend-friendly pattern cards with chart payloads and example dates."""
         items: List[Dict[str, Any]] = []
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_short = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
         fmt = PatternRecognitionService._format_display_value
         segs = PatternRecognitionService._distribution_segments
         axis_label = PatternRecognitionService._field_axis_label(field_name)
@@ -317,14 +482,12 @@ class PatternRecognitionService:
             return [
                 item['entry_date'].isoformat()
                 for item in extracted_data
-                if item.get('value') is not None and item['entry_date'].weekday() == weekday
+                if item['entry_date'].weekday() == weekday
             ][-limit:]
 
         def dates_in_month_period(period: str, limit: int = 8) -> List[str]:
             result = []
             for item in extracted_data:
-                if item.get('value') is None:
-                    continue
                 dom = item['entry_date'].day
                 bucket = 'early' if dom <= 10 else 'mid' if dom <= 20 else 'late'
                 if bucket == period:
@@ -340,13 +503,13 @@ class PatternRecognitionService:
                 labels = []
                 values = []
                 for dow in range(7):
-                    labels.append(day_short[dow])
+                    labels.append(_DAY_SHORT_NAMES[dow])
                     if dow in stats:
                         values.append(round(float(stats[dow]['mean']), 1))
                     else:
                         values.append(0)
                 high_day = p.get('highest_day', {}).get('day')
-                high_dow = day_names.index(high_day) if high_day in day_names else None
+                high_dow = _DAY_NAMES.index(high_day) if high_day in _DAY_NAMES else None
                 viz = bar_viz(
                     x_labels=labels,
                     y_axis_label=axis_label,
@@ -362,16 +525,16 @@ class PatternRecognitionService:
                     if dp:
                         total = dp.get('count', 0)
                         rows.append({
-                            'label': day_short[dow],
+                            'label': _DAY_SHORT_NAMES[dow],
                             'segments': segs(dp.get('frequency') or {}, total),
                             'total': total,
                         })
                     else:
-                        rows.append({'label': day_short[dow], 'segments': [], 'total': 0})
+                        rows.append({'label': _DAY_SHORT_NAMES[dow], 'segments': [], 'total': 0})
                 x_labels, series, show_legend = grouped(rows)
                 top = (p.get('consistent_patterns') or [{}])[0]
                 target_day = top.get('day')
-                target_dow = day_names.index(target_day) if target_day in day_names else None
+                target_dow = _DAY_NAMES.index(target_day) if target_day in _DAY_NAMES else None
                 top_value = fmt(top.get('value'))
                 viz = bar_viz(
                     x_labels=x_labels,
@@ -512,14 +675,13 @@ class PatternRecognitionService:
         if 'cycle_phases' in patterns:
             p = patterns['cycle_phases']
             phase_labels = ['Period', 'Follicular', 'Ovulation', 'Luteal']
-            phase_keys = ['menstruation', 'follicular', 'ovulation', 'luteal']
 
             if p.get('type') == 'numeric' and p.get('phase_statistics'):
                 stats = p['phase_statistics']
                 labels = []
                 values = []
                 high_phase = (p.get('highest_phase') or {}).get('phase', '')
-                for i, (label, key) in enumerate(zip(phase_labels, phase_keys)):
+                for i, (label, key) in enumerate(zip(phase_labels, _PHASE_NAMES)):
                     labels.append(label)
                     values.append(round(float(stats[key]['average']), 1) if key in stats else 0)
                 viz = bar_viz(
@@ -531,7 +693,7 @@ class PatternRecognitionService:
                 )
             elif p.get('phase_patterns'):
                 rows = []
-                for label, key in zip(phase_labels, phase_keys):
+                for label, key in zip(phase_labels, _PHASE_NAMES):
                     pp = p.get('phase_patterns', {}).get(key)
                     if pp:
                         freq_parts = str(pp.get('frequency', '0/0')).split('/')
@@ -580,9 +742,56 @@ class PatternRecognitionService:
 
         return items
     
+    @staticmethod
+    def _categorical_frequencies_by_group(
+        group_ids: np.ndarray,
+        values: List[Any],
+        n_groups: int
+    ) -> List[Tuple[Optional[str], Dict[str, int]]]:
+        """
+        Most common value and frequency table per group, in one pass over the values.
+        
+        Values are normalised like AnalyticsStatsCalculator.calculate_categorical_stats
+        (str, lower-cased, stripped). Each frequency dict lists values in order of
+        first appearance within its group, and ties for the mode go to the value
+        seen first - both as the per-group calculation does. Groups without
+        values get (None, {}).
+        """
+        normalized = np.array([str(value).lower().strip() for value in values], dtype=str)
+        labels, codes = np.unique(normalized, return_inverse=True)
+        labels = labels.tolist()
+        n_codes = len(labels)
+        if not n_codes:
+            return [(None, {})] * n_groups
+        
+        # One cell per (group, value) pair
+        cells = group_ids * n_codes + codes
+        counts = np.bincount(cells, minlength=n_groups * n_codes).reshape(n_groups, n_codes)
+        first_seen = np.full(n_groups * n_codes, len(cells))
+        np.minimum.at(first_seen, cells, np.arange(len(cells)))
+        first_seen = first_seen.reshape(n_groups, n_codes)
+        
+        # Most frequent value per group, earliest seen on ties
+        is_top = counts == counts.max(axis=1, keepdims=True, initial=0)
+        mode_codes = np.where(is_top, first_seen, len(cells)).argmin(axis=1).tolist()
+        
+        results = []
+        for group in range(n_groups):
+            present = np.flatnonzero(counts[group])
+            if not len(present):
+                results.append((None, {}))
+                continue
+            present = present[np.argsort(first_seen[group, present])]
+            results.append((
+                labels[mode_codes[group]],
+                {labels[code]: int(counts[group, code]) for code in present.tolist()}
+            ))
+        
+        return results
+    
     @staticmethod
     def _detect_day_of_week_patterns(
-        data: List[Dict],
+        columns: ExtractedColumns,
         field_name: str,
         field_type: str,
         min_confidence: float
@@ -595,30 +804,37 @@ class PatternRecognitionService:
         - "Mood is low on Mondays"
         - "Energy peaks on Wednesdays"
         """
-        # Group by day of week (0=Monday, 6=Sunday)
-        dow_groups = defaultdict(list)
-        for item in data:
-            dow = item['entry_date'].weekday()
-            if item['value'] is not None:
-                dow_groups[dow].append(item['value'])
+        dows = columns.dows
+        counts = np.bincount(dows, minlength=7)
+        
+        # Days in order of first appearance, so ties between days resolve the
+        # same way the per-day grouping always has
+        seen_days, first_index = np.unique(dows, return_index=True)
+        seen_days = seen_days[np.argsort(first_index)].tolist()
         
         # Need data for at least 5 different days
-        if len(dow_groups) < 5:
+        if len(seen_days) < 5:
             return None
         
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
         if field_type == 'numeric':
+            values = columns.values
+            
+            # Per-day mean and (population) std dev from count/sum/sum-of-squares
+            sums = np.bincount(dows, weights=values, minlength=7)
+            squares = np.bincount(dows, weights=values * values, minlength=7)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                day_means = sums / counts
+                day_stds = np.sqrt(np.maximum(squares / counts - day_means * day_means, 0.0))
+            
             # Calculate average for each day
             dow_stats = {}
-            for dow, values in dow_groups.items():
-                if len(values) >= 2:  # At least 2 occurrences
-                    stats_calc = AnalyticsStatsCalculator.calculate_numeric_stats(values)
+            for dow in seen_days:
+                if counts[dow] >= 2:  # At least 2 occurrences
                     dow_stats[dow] = {
-                        'day': day_names[dow],
-                        'count': len(values),
-                        'mean': stats_calc['mean'],
-                        'std_dev': stats_calc['std_dev']
+                        'day': _DAY_NAMES[dow],
+                        'count': int(counts[dow]),
+                        'mean': round(float(day_means[dow]), 2),
+                        'std_dev': round(float(day_stds[dow]), 2)
                     }
             
             if len(dow_stats) < 2:
@@ -645,18 +861,12 @@ class PatternRecognitionService:
                 return None
             
             # Weekend vs weekday comparison
-            weekday_values = []
-            weekend_values = []
-            for dow, values in dow_groups.items():
-                if dow < 5:  # Monday-Friday
-                    weekday_values.extend(values)
-                else:  # Saturday-Sunday
-                    weekend_values.extend(values)
+            is_weekday = dows < 5  # Monday-Friday
             
             weekend_vs_weekday = None
-            if weekday_values and weekend_values:
-                weekday_avg = np.mean(weekday_values)
-                weekend_avg = np.mean(weekend_values)
+            if is_weekday.any() and not is_weekday.all():
+                weekday_avg = values[is_weekday].mean()
+                weekend_avg = values[~is_weekday].mean()
                 diff = weekend_avg - weekday_avg
                 
                 if abs(diff) > 1 or abs(diff / weekday_avg * 100) > 15:
@@ -671,12 +881,12 @@ class PatternRecognitionService:
                 'type': 'numeric',
                 'day_statistics': dow_stats,
                 'highest_day': {
-                    'day': day_names[highest_dow],
+                    'day': _DAY_NAMES[highest_dow],
                     'average': round(highest_mean, 2),
                     'occurrences': dow_stats[highest_dow]['count']
                 },
                 'lowest_day': {
-                    'day': day_names[lowest_dow],
+                    'day': _DAY_NAMES[lowest_dow],
                     'average': round(lowest_mean, 2),
                     'occurrences': dow_stats[lowest_dow]['count']
                 },
@@ -685,22 +895,26 @@ class PatternRecognitionService:
                 'weekend_vs_weekday': weekend_vs_weekday,
                 'confidence': 'high' if percent_diff > 30 else 'medium',
                 'insight': PatternRecognitionService._generate_dow_numeric_insight(
-                    field_name, day_names[highest_dow], day_names[lowest_dow],
+                    field_name, _DAY_NAMES[highest_dow], _DAY_NAMES[lowest_dow],
                     highest_mean, lowest_mean, weekend_vs_weekday
                 )
             }
         
         else:  # Categorical
+            day_frequencies = PatternRecognitionService._categorical_frequencies_by_group(
+                dows, columns.values.tolist(), 7
+            )
+            
             # Find most common value for each day
             dow_patterns = {}
-            for dow, values in dow_groups.items():
-                if len(values) >= 2:
-                    stats_calc = AnalyticsStatsCalculator.calculate_categorical_stats(values)
+            for dow in seen_days:
+                if counts[dow] >= 2:
+                    mode, frequency = day_frequencies[dow]
                     dow_patterns[dow] = {
-                        'day': day_names[dow],
-                        'count': len(values),
-                        'most_common': stats_calc['mode'],
-                        'frequency': stats_calc['frequency']
+                        'day': _DAY_NAMES[dow],
+                        'count': int(counts[dow]),
+                        'most_common': mode,
+                        'frequency': frequency
                     }
             
             if len(dow_patterns) < 2:
@@ -714,7 +928,7 @@ class PatternRecognitionService:
                 
                 if consistency >= min_confidence:
                     consistent_patterns.append({
-                        'day': day_names[dow],
+                        'day': _DAY_NAMES[dow],
                         'value': pattern['most_common'],
                         'frequency': f"{mode_count}/{pattern['count']}",
                         'consistency': round(consistency * 100, 1)
@@ -735,7 +949,7 @@ class PatternRecognitionService:
     
     @staticmethod
     def _detect_time_of_month_patterns(
-        data: List[Dict],
+        columns: ExtractedColumns,
         field_name: str,
         field_type: str,
         min_confidence: float
@@ -748,29 +962,18 @@ class PatternRecognitionService:
         - Mid month: days 11-20
         - Late month: days 21-31
         """
-        # Group by month period
-        early_month = []  # 1-10
-        mid_month = []    # 11-20
-        late_month = []   # 21-31
-        
-        for item in data:
-            day_of_month = item['entry_date'].day
-            if item['value'] is not None:
-                if day_of_month <= 10:
-                    early_month.append(item['value'])
-                elif day_of_month <= 20:
-                    mid_month.append(item['value'])
-                else:
-                    late_month.append(item['value'])
+        # Month period per entry: 0=early, 1=mid, 2=late
+        buckets = np.digitize(columns.days_of_month, [11, 21])
+        counts = np.bincount(buckets, minlength=3)
         
         # Need data in all periods
-        if not (early_month and mid_month and late_month):
+        if not counts.all():
             return None
         
         if field_type == 'numeric':
-            early_avg = np.mean(early_month)
-            mid_avg = np.mean(mid_month)
-            late_avg = np.mean(late_month)
+            early_avg, mid_avg, late_avg = (
+                np.bincount(buckets, weights=columns.values, minlength=3) / counts
+            )
             
             # Find highest and lowest periods
             periods = {
@@ -793,48 +996,42 @@ class PatternRecognitionService:
             if percent_diff < 15 and difference < 1:
                 return None
             
-            period_labels = {
-                'early': 'Early Month (1-10)',
-                'mid': 'Mid Month (11-20)',
-                'late': 'Late Month (21-31)'
-            }
-            
             return {
                 'type': 'numeric',
                 'early_month': {
                     'average': round(early_avg, 2),
-                    'count': len(early_month)
+                    'count': int(counts[0])
                 },
                 'mid_month': {
                     'average': round(mid_avg, 2),
-                    'count': len(mid_month)
+                    'count': int(counts[1])
                 },
                 'late_month': {
                     'average': round(late_avg, 2),
-                    'count': len(late_month)
+                    'count': int(counts[2])
                 },
                 'highest_period': {
-                    'period': period_labels[highest_period],
+                    'period': _MONTH_PERIOD_LABELS[highest_period],
                     'average': round(periods[highest_period], 2)
                 },
                 'lowest_period': {
-                    'period': period_labels[lowest_period],
+                    'period': _MONTH_PERIOD_LABELS[lowest_period],
                     'average': round(periods[lowest_period], 2)
                 },
                 'difference': round(difference, 2),
                 'confidence': 'high' if percent_diff > 25 else 'medium',
-                'insight': f"Your {field_name} tends to be {round(difference, 1)} units higher during {period_labels[highest_period].lower()} compared to {period_labels[lowest_period].lower()}"
+                'insight': f"Your {field_name} tends to be {round(difference, 1)} units higher during {_MONTH_PERIOD_LABELS[highest_period].lower()} compared to {_MONTH_PERIOD_LABELS[lowest_period].lower()}"
             }
         
         else:  # Categorical
-            early_stats = AnalyticsStatsCalculator.calculate_categorical_stats(early_month)
-            mid_stats = AnalyticsStatsCalculator.calculate_categorical_stats(mid_month)
-            late_stats = AnalyticsStatsCalculator.calculate_categorical_stats(late_month)
+            (early_mode, early_frequency), (mid_mode, mid_frequency), (late_mode, late_frequency) = (
+                PatternRecognitionService._categorical_frequencies_by_group(
+                    buckets, columns.values.tolist(), 3
+                )
+            )
             
             # Check for consistency
-            consistent = (
-                early_stats['mode'] == mid_stats['mode'] == late_stats['mode']
-            )
+            consistent = early_mode == mid_mode == late_mode
             
             if consistent:
                 return None  # No variation
@@ -842,28 +1039,29 @@ class PatternRecognitionService:
             return {
                 'type': 'categorical',
                 'early_month': {
-                    'most_common': early_stats['mode'],
-                    'frequency': early_stats['frequency'],
-                    'count': len(early_month)
+                    'most_common': early_mode,
+                    'frequency': early_frequency,
+                    'count': int(counts[0])
                 },
                 'mid_month': {
-                    'most_common': mid_stats['mode'],
-                    'frequency': mid_stats['frequency'],
-                    'count': len(mid_month)
+                    'most_common': mid_mode,
+                    'frequency': mid_frequency,
+                    'count': int(counts[1])
                 },
                 'late_month': {
-                    'most_common': late_stats['mode'],
-                    'frequency': late_stats['frequency'],
-                    'count': len(late_month)
+                    'most_common': late_mode,
+                    'frequency': late_frequency,
+                    'count': int(counts[2])
                 },
                 'confidence': 'medium',
-                'insight': f"Your {field_name} varies throughout the month: typically '{early_stats['mode']}' early month, '{mid_stats['mode']}' mid month, and '{late_stats['mode']}' late month"
+                'insight': f"Your {field_name} varies throughout the month: typically '{early_mode}' early month, '{mid_mode}' mid month, and '{late_mode}' late month"
             }
     
     @staticmethod
     def _detect_cycle_phase_patterns(
-        tracker_id: int,
-        data: List[Dict],
+        settings: Dict[str, Any],
+        cycle_starts: List[date],
+        columns: ExtractedColumns,
         field_name: str,
         field_type: str,
         min_confidence: float
@@ -876,52 +1074,55 @@ class PatternRecognitionService:
         - "Discharge is creamy when period ends"
         - "Pain spikes during ovulation"
         - "Mood drops in luteal phase"
+        
+        settings are the tracker's cycle settings and cycle_starts the cycle
+        start dates in ascending order (PeriodCycleService.get_all_cycles); both
+        are loaded by the caller, so this only computes. Repeated starts are
+        harmless: every copy gives an entry the same cycle day.
         """
-        settings = PeriodCycleService.get_tracker_settings(tracker_id)
+        # Phase boundaries (last cycle day of each phase), kept sorted by a
+        # running max so a period longer than the follicular boundary leaves
+        # that phase empty
+        phase_bounds = np.maximum.accumulate([
+            settings['average_period_length'],
+            (settings['average_cycle_length'] // 2) - 2,
+            (settings['average_cycle_length'] // 2) + 2
+        ])
         
-        # Annotate data with cycle phases
-        phase_groups = {
-            'menstruation': [],
-            'follicular': [],
-            'ovulation': [],
-            'luteal': []
-        }
+        # Find cycle for each date (the latest one starting on or before it)
+        starts = np.array(cycle_starts, dtype='datetime64[D]')
+        cycle_index = np.searchsorted(starts, columns.dates, side='right') - 1
+        in_cycle = cycle_index >= 0
+        values = columns.values[in_cycle]
         
-        for item in data:
-            # Find cycle for this date
-            cycle = PeriodCycleService.find_cycle_for_date(tracker_id, item['entry_date'])
-            if not cycle or item['value'] is None:
-                continue
-            
-            # Calculate cycle day and phase
-            days_since_start = (item['entry_date'] - cycle.cycle_start_date).days + 1
-            
-            # Determine phase based on cycle day
-            if days_since_start <= settings['average_period_length']:
-                phase = 'menstruation'
-            elif days_since_start <= (settings['average_cycle_length'] // 2) - 2:
-                phase = 'follicular'
-            elif days_since_start <= (settings['average_cycle_length'] // 2) + 2:
-                phase = 'ovulation'
-            else:
-                phase = 'luteal'
-            
-            phase_groups[phase].append(item['value'])
+        # Calculate cycle day and phase (index into _PHASE_NAMES): the first
+        # phase whose last day the cycle day does not pass, by binary search
+        cycle_days = (columns.dates[in_cycle] - starts[cycle_index[in_cycle]]).astype(np.intp) + 1
+        phase_ids = np.searchsorted(phase_bounds, cycle_days, side='left')
         
-        # Filter phases with sufficient data
-        valid_phases = {p: v for p, v in phase_groups.items() if len(v) >= 2}
+        phase_counts = np.bincount(phase_ids, minlength=len(_PHASE_NAMES))
+        
+        # Phases with sufficient data
+        valid_phases = [p for p in range(len(_PHASE_NAMES)) if phase_counts[p] >= 2]
         
         if len(valid_phases) < 2:
             return None
         
         if field_type == 'numeric':
+            # Running (count, sum, sum of squares) per phase - no per-phase value lists
+            totals = np.zeros((len(_PHASE_NAMES), 3))
+            np.add.at(totals[:, 0], phase_ids, 1)
+            np.add.at(totals[:, 1], phase_ids, values)
+            np.add.at(totals[:, 2], phase_ids, values * values)
+            
             phase_stats = {}
-            for phase, values in valid_phases.items():
-                stats_calc = AnalyticsStatsCalculator.calculate_numeric_stats(values)
-                phase_stats[phase] = {
-                    'average': stats_calc['mean'],
-                    'count': len(values),
-                    'std_dev': stats_calc['std_dev']
+            for p in valid_phases:
+                count, total, total_sq = totals[p]
+                mean = total / count
+                phase_stats[_PHASE_NAMES[p]] = {
+                    'average': round(float(mean), 2),
+                    'count': int(count),
+                    'std_dev': round(float(np.sqrt(max(total_sq / count - mean * mean, 0.0))), 2)
                 }
             
             # Find most and least affected phases
@@ -935,61 +1136,51 @@ class PatternRecognitionService:
             if percent_diff < 20 and difference < 1:
                 return None
             
-            phase_labels = {
-                'menstruation': 'menstrual phase',
-                'follicular': 'follicular phase',
-                'ovulation': 'ovulation',
-                'luteal': 'luteal phase'
-            }
-            
             return {
                 'type': 'numeric',
                 'phase_statistics': phase_stats,
                 'highest_phase': {
-                    'phase': phase_labels[highest_phase],
+                    'phase': _PHASE_LABELS_NUMERIC[highest_phase],
                     'average': round(means[highest_phase], 2)
                 },
                 'lowest_phase': {
-                    'phase': phase_labels[lowest_phase],
+                    'phase': _PHASE_LABELS_NUMERIC[lowest_phase],
                     'average': round(means[lowest_phase], 2)
                 },
                 'confidence': 'high' if percent_diff > 30 else 'medium',
-                'insight': f"Your {PatternRecognitionService._get_field_display_name(field_name, highest_phase)} peaks during {phase_labels[highest_phase]} ({round(means[highest_phase], 1)}) and is lowest during {phase_labels[lowest_phase]} ({round(means[lowest_phase], 1)})"
+                'insight': f"Your {PatternRecognitionService._get_field_display_name(field_name, highest_phase)} peaks during {_PHASE_LABELS_NUMERIC[highest_phase]} ({round(means[highest_phase], 1)}) and is lowest during {_PHASE_LABELS_NUMERIC[lowest_phase]} ({round(means[lowest_phase], 1)})"
             }
         
         else:  # Categorical
+            phase_frequencies = PatternRecognitionService._categorical_frequencies_by_group(
+                phase_ids, values.tolist(), len(_PHASE_NAMES)
+            )
+            
             phase_patterns = {}
-            for phase, values in valid_phases.items():
-                if len(values) >= 2:
-                    stats_calc = AnalyticsStatsCalculator.calculate_categorical_stats(values)
-                    mode_count = stats_calc['frequency'].get(stats_calc['mode'], 0)
-                    consistency = mode_count / len(values)
-                    
-                    if consistency >= min_confidence:
-                        phase_patterns[phase] = {
-                            'most_common': stats_calc['mode'],
-                            'frequency': f"{mode_count}/{len(values)}",
-                            'consistency': round(consistency * 100, 1),
-                            'count': len(values)
-                        }
+            for p in valid_phases:
+                mode, frequency = phase_frequencies[p]
+                count = int(phase_counts[p])
+                mode_count = frequency.get(mode, 0)
+                consistency = mode_count / count
+                
+                if consistency >= min_confidence:
+                    phase_patterns[_PHASE_NAMES[p]] = {
+                        'most_common': mode,
+                        'frequency': f"{mode_count}/{count}",
+                        'consistency': round(consistency * 100, 1),
+                        'count': count
+                    }
             
             if not phase_patterns:
                 return None
             
-            phase_labels = {
-                'menstruation': 'when period ends',
-                'follicular': 'in follicular phase',
-                'ovulation': 'during ovulation',
-                'luteal': 'in luteal phase'
-            }
-            
             # Generate specific insights
             insights = []
             for phase, pattern in phase_patterns.items():
                 # Use "period flow" instead of "discharge" during menstruation
                 display_name = PatternRecognitionService._get_field_display_name(field_name, phase)
                 insights.append(
-                    f"Your {display_name} is typically '{pattern['most_common']}' {phase_labels[phase]} "
+                    f"Your {display_name} is typically '{pattern['most_common']}' {_PHASE_LABELS_CATEGORICAL[phase]} "
                     f"({pattern['consistency']}% of the time)"
                 )
             
@@ -1002,7 +1193,7 @@ class PatternRecognitionService:
     
     @staticmethod
     def _detect_streak_patterns(
-        data: List[Dict],
+        columns: ExtractedColumns,
         field_name: str,
         field_type: str
     ) -> Optional[Dict[str, Any]]:
@@ -1012,129 +1203,109 @@ class PatternRecognitionService:
         For numeric: "3 days in a row of high/low values"
         For categorical: "3 days in a row of 'cramps'" or "2 days in a row of 'bloating'"
         """
-        if len(data) < 5:
+        if len(columns.values) < 5:
             return None
         
-        # Sort by date
-        sorted_data = sorted(data, key=lambda x: x['entry_date'])
+        # Columns are already in date order (the entry query sorts by entry_date
+        # and extraction preserves it)
+        dates = columns.dates
+        values = columns.values
         
         if field_type == 'numeric':
-            return PatternRecognitionService._detect_numeric_streaks(sorted_data, field_name)
+            return PatternRecognitionService._detect_numeric_streaks(dates, values, field_name)
         else:
-            return PatternRecognitionService._detect_categorical_streaks(sorted_data, field_name)
+            return PatternRecognitionService._detect_categorical_streaks(dates, values.tolist(), field_name)
+    
+    @staticmethod
+    def _find_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Start indices and lengths of the runs of consecutive True values in a boolean array.
+        
+        Masks shorter than _VECTOR_RUN_SCAN_MIN are scanned in Python, which is
+        faster there; longer ones take the diff of the padded mask.
+        """
+        if len(mask) < _VECTOR_RUN_SCAN_MIN:
+            return PatternRecognitionService._find_runs_scalar(mask)
+        
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+        starts = edges[::2]
+        return starts, edges[1::2] - starts
+    
+    @staticmethod
+    def _find_runs_scalar(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Pure-Python _find_runs for short masks."""
+        starts: List[int] = []
+        lengths: List[int] = []
+        run = 0
+        for index, present in enumerate(mask.tolist()):
+            if present:
+                run += 1
+            elif run:
+                starts.append(index - run)
+                lengths.append(run)
+                run = 0
+        if run:
+            starts.append(len(mask) - run)
+            lengths.append(run)
+        return np.array(starts, dtype=np.intp), np.array(lengths, dtype=np.intp)
+    
+    @staticmethod
+    def _streaks_with_dates(
+        dates: np.ndarray,
+        starts: np.ndarray,
+        lengths: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Streak dicts for the runs of 2+ entries, in order.
+        
+        Only the start and end dates of the kept runs are formatted, in one
+        vectorized call each rather than an isoformat() per date.
+        """
+        keep = lengths >= 2
+        starts, lengths = starts[keep], lengths[keep]
+        start_dates = np.datetime_as_string(dates[starts]).tolist()
+        end_dates = np.datetime_as_string(dates[starts + lengths - 1]).tolist()
+        return [
+            {
+                'start_date': start_date,
+                'end_date': end_date,
+                'length': length
+            }
+            for start_date, end_date, length in zip(start_dates, end_dates, lengths.tolist())
+        ]
     
     @staticmethod
     def _detect_numeric_streaks(
-        sorted_data: List[Dict],
+        dates: np.ndarray,
+        values: np.ndarray,
         field_name: str
     ) -> Optional[Dict[str, Any]]:
-        """Detect streaks for numeric values (high/low based on thresholds)."""
-        # Calculate overall average
-        values = [item['value'] for item in sorted_data if item['value'] is not None]
-        if not values:
+        """
+        Detect streaks for numeric values (high/low based on thresholds), given
+        date-sorted columns.
+        
+        A streak is a run of consecutive entries on the same side of the
+        thresholds, so the scan is a run-length encoding of each side's mask.
+        """
+        if not len(values):
             return None
         
-        overall_avg = np.mean(values)
-        overall_std = np.std(values)
+        # Calculate overall average; std reuses it instead of recomputing it
+        overall_avg = values.mean()
+        overall_std = np.std(values, mean=overall_avg)
         
         # Define thresholds
         high_threshold = overall_avg + (0.5 * overall_std)
         low_threshold = overall_avg - (0.5 * overall_std)
         
-        # Find streaks
-        current_high_streak = 0
-        current_low_streak = 0
-        max_high_streak = 0
-        max_low_streak = 0
-        high_streak_count = 0
-        low_streak_count = 0
-        
-        # Track streak details with dates
-        high_streaks = []  # List of streak dicts: {start_date, end_date, length}
-        low_streaks = []   # List of streak dicts: {start_date, end_date, length}
-        current_high_start = None
-        current_low_start = None
-        prev_date = None
-        
-        def end_high_streak():
-            if current_high_streak >= 2 and current_high_start and prev_date:
-                high_streaks.append({
-                    'start_date': current_high_start.isoformat(),
-                    'end_date': prev_date.isoformat(),
-                    'length': current_high_streak
-                })
-                return True
-            return False
-        
-        def end_low_streak():
-            if current_low_streak >= 2 and current_low_start and prev_date:
-                low_streaks.append({
-                    'start_date': current_low_start.isoformat(),
-                    'end_date': prev_date.isoformat(),
-                    'length': current_low_streak
-                })
-                return True
-            return False
-        
-        def reset_high_streak():
-            nonlocal current_high_streak, current_high_start
-            current_high_streak = 0
-            current_high_start = None
-        
-        def reset_low_streak():
-            nonlocal current_low_streak, current_low_start
-            current_low_streak = 0
-            current_low_start = None
-        
-        for i, item in enumerate(sorted_data):
-            if item['value'] is None:
-                # End current streaks if any (missing data breaks streak)
-                end_high_streak()
-                end_low_streak()
-                reset_high_streak()
-                reset_low_streak()
-                continue
-            
-            if item['value'] > high_threshold:
-                # Start new high streak if this is the first day
-                if current_high_streak == 0:
-                    current_high_start = item['entry_date']
-                
-                # End low streak if it was >= 2 days
-                end_low_streak()
-                reset_low_streak()
-                
-                current_high_streak += 1
-                max_high_streak = max(max_high_streak, current_high_streak)
-                if current_high_streak >= 2:
-                    high_streak_count += 1
-                
-            elif item['value'] < low_threshold:
-                # Start new low streak if this is the first day
-                if current_low_streak == 0:
-                    current_low_start = item['entry_date']
-                
-                # End high streak if it was >= 2 days
-                end_high_streak()
-                reset_high_streak()
-                
-                current_low_streak += 1
-                max_low_streak = max(max_low_streak, current_low_streak)
-                if current_low_streak >= 2:
-                    low_streak_count += 1
-                
-            else:
-                # Value is normal - end any active streaks
-                end_high_streak()
-                end_low_streak()
-                reset_high_streak()
-                reset_low_streak()
-            
-            prev_date = item['entry_date']
+        def collect_streaks(mask: np.ndarray) -> Tuple[int, int, List[Dict[str, Any]]]:
+            """(longest run, days past the first in runs, streaks of 2+ days with dates)."""
+            starts, lengths = PatternRecognitionService._find_runs(mask)
+            streaks = PatternRecognitionService._streaks_with_dates(dates, starts, lengths)
+            return int(lengths.max(initial=0)), int((lengths - 1).sum()), streaks
         
-        # Finalize any streaks that are still active at the end
-        end_high_streak()
-        end_low_streak()
+        max_high_streak, high_streak_count, high_streaks = collect_streaks(values > high_threshold)
+        max_low_streak, low_streak_count, low_streaks = collect_streaks(values < low_threshold)
         
         if max_high_streak < 2 and max_low_streak < 2:
             return None
@@ -1160,103 +1331,80 @@ class PatternRecognitionService:
     
     @staticmethod
     def _detect_categorical_streaks(
-        sorted_data: List[Dict],
+        dates: np.ndarray,
+        values: List[Any],
         field_name: str
     ) -> Optional[Dict[str, Any]]:
         """
-        Detect streaks for categorical values (e.g., "cramps" for 3 days in a row).
+        Detect streaks for categorical values (e.g., "cramps" for 3 days in a row),
+        given date-sorted columns.
         
         Handles both single values and arrays (e.g., ["cramps", "bloating"]).
         """
-        # Extract all unique values that appear
+        # Extract all unique values that appear (values are never None - see
+        # ExtractedColumns), noting each (entry, value) occurrence on the way
         all_values = set()
-        for item in sorted_data:
-            if item['value'] is None:
-                continue
+        rows: List[int] = []
+        occurrences: List[Any] = []
+        for row, item_value in enumerate(values):
             # Handle both single values and arrays
-            if isinstance(item['value'], list):
-                all_values.update(item['value'])
+            if isinstance(item_value, list):
+                all_values.update(item_value)
+                rows.extend([row] * len(item_value))
+                occurrences.extend(item_value)
             else:
-                all_values.add(str(item['value']))
+                item_value = str(item_value)
+                all_values.add(item_value)
+                rows.append(row)
+                occurrences.append(item_value)
         
         if not all_values:
             return None
         
+        # Presence matrix: present[j, i + 1] is 1 when entry i has value j
+        # (rows follow the set's order, which decides ties below), filled with
+        # a single scatter and padded with an empty column on each side
+        labels = list(all_values)
+        value_ids = {value: value_id for value_id, value in enumerate(labels)}
+        present = np.zeros((len(labels), len(values) + 2), dtype=np.int8)
+        present[[value_ids[value] for value in occurrences], np.add(rows, 1)] = 1
+        
+        # Gaps and islands for every value at once: along each row a run starts
+        # where the difference is +1 and ends where it is -1, and nonzero()
+        # lists both row by row, so the k-th start and end of a value pair up
+        edges = np.diff(present, axis=1)
+        run_values, starts = np.nonzero(edges == 1)
+        ends = np.nonzero(edges == -1)[1]
+        lengths = ends - starts
+        
+        # Every value occurs, so each has at least one run: its runs are the
+        # slice run_bounds[j]:run_bounds[j + 1]
+        run_bounds = np.searchsorted(run_values, np.arange(len(labels) + 1))
+        longest_streaks = np.maximum.reduceat(lengths, run_bounds[:-1])
+        days_in_streaks = np.add.reduceat(lengths - 1, run_bounds[:-1])
+        
         # Track streaks for each categorical value
         value_streaks = {}  # {value: {streaks: [], longest: int, total_days: int}}
         
-        for value in all_values:
-            current_streak = 0
-            current_start = None
-            streaks = []
-            longest_streak = 0
-            total_days = 0
-            prev_date = None
-            
-            for item in sorted_data:
-                if item['value'] is None:
-                    # End streak if it was >= 2 days
-                    if current_streak >= 2 and current_start and prev_date:
-                        streaks.append({
-                            'start_date': current_start.isoformat(),
-                            'end_date': prev_date.isoformat(),
-                            'length': current_streak
-                        })
-                    current_streak = 0
-                    current_start = None
-                    continue
-                
-                # Check if this value is present (handles both single and array)
-                value_present = False
-                if isinstance(item['value'], list):
-                    value_present = value in item['value']
-                else:
-                    value_present = str(item['value']) == value
-                
-                if value_present:
-                    # Start new streak if this is the first day
-                    if current_streak == 0:
-                        current_start = item['entry_date']
-                    
-                    current_streak += 1
-                    longest_streak = max(longest_streak, current_streak)
-                    if current_streak >= 2:
-                        total_days += 1
-                else:
-                    # End streak if it was >= 2 days
-                    if current_streak >= 2 and current_start and prev_date:
-                        streaks.append({
-                            'start_date': current_start.isoformat(),
-                            'end_date': prev_date.isoformat(),
-                            'length': current_streak
-                        })
-                    current_streak = 0
-                    current_start = None
-                
-                prev_date = item['entry_date']
-            
-            # Finalize any streak still active at the end
-            if current_streak >= 2 and current_start and prev_date:
-                streaks.append({
-                    'start_date': current_start.isoformat(),
-                    'end_date': prev_date.isoformat(),
-                    'length': current_streak
-                })
-            
-            # Only include values with meaningful streaks (>= 2 days)
-            if longest_streak >= 2:
-                value_streaks[value] = {
-                    'longest_streak': longest_streak,
-                    'total_days_in_streaks': total_days,
-                    'streaks': streaks,
-                    'streak_count': len(streaks)
-                }
+        # Only include values with meaningful streaks (>= 2 days)
+        for value_id in np.flatnonzero(longest_streaks >= 2).tolist():
+            first, last = run_bounds[value_id], run_bounds[value_id + 1]
+            streaks = PatternRecognitionService._streaks_with_dates(
+                dates, starts[first:last], lengths[first:last]
+            )
+            value_streaks[labels[value_id]] = {
+                'longest_streak': int(longest_streaks[value_id]),
+                'total_days_in_streaks': int(days_in_streaks[value_id]),
+                'streaks': streaks,
+                'streak_count': len(streaks)
+            }
         
         if not value_streaks:
             return None
         
-        # Find the value with the longest streak
-        top_value = max(value_streaks, key=lambda v: value_streaks[v]['longest_streak'])
+        # Find the value with the longest streak (the first in set order on
+        # ties, as value_streaks is filled in that order)
+        top_value = labels[int(longest_streaks.argmax())]
         top_streak_info = value_streaks[top_value]
         
         return {
@@ -1282,7 +1430,9 @@ class PatternRecognitionService:
             return f"No significant streaks detected for {field_name}"
         
         insights = []
-        for value, info in sorted(value_streaks.items(), key=lambda x: x[1]['longest_streak'], reverse=True)[:3]:
+        # nlargest keeps the first-seen order among equal streaks, like the
+        # stable reverse sort it replaces, without sorting every value
+        for value, info in heapq.nlargest(3, value_streaks.items(), key=lambda x: x[1]['longest_streak']):
             if info['longest_streak'] >= 3:
                 insights.append(
                     f"You had '{value}' for {info['longest_streak']} consecutive days"
@@ -1300,12 +1450,14 @@ class PatternRecognitionService:
     # Helper methods for generating insights
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def _get_field_display_name(field_name: str, phase: Optional[str] = None) -> str:
         """
         Get appropriate display name for field based on context.
         
         For discharge fields during menstruation, use "period flow".
-        Otherwise use the field name as-is.
+        Otherwise use the field name as-is. Memoized: insight strings ask for
+        the same few (field, phase) pairs over and over.
         
         Examples:
         - "discharge" during menstruation → "period flow"
@@ -1393,21 +1545,12 @@ class PatternRecognitionService:
         """Generate overall insights from all detected patterns."""
         insights = []
         
-        # Day of week insights
-        if 'day_of_week' in patterns:
-            insights.append(patterns['day_of_week']['insight'])
-        
-        # Time of month insights
-        if 'time_of_month' in patterns:
-            insights.append(patterns['time_of_month']['insight'])
-        
-        # Cycle phase insights (period tracker)
-        if 'cycle_phases' in patterns:
-            insights.append(patterns['cycle_phases']['insight'])
-        
-        # Streak insights
-        if 'streaks' in patterns:
-            insights.append(patterns['streaks']['insight'])
+        # Day of week, time of month, cycle phase (period tracker) and streak
+        # insights, in that order
+        for key in ('day_of_week', 'time_of_month', 'cycle_phases', 'streaks'):
+            pattern = patterns.get(key)
+            if pattern is not None:
+                insights.append(pattern['insight'])
         
         # Summary insight
         if len(insights) > 1:
@@ -1422,10 +1565,12 @@ class PatternRecognitionService:
     def _calculate_pattern_strength(patterns: Dict) -> Dict[str, Any]:
         """Calculate overall strength of detected patterns."""
         total_patterns = len(patterns)
-        high_confidence = sum(
-            1 for p in patterns.values()
-            if isinstance(p, dict) and p.get('confidence') == 'high'
-        )
+        # Plain counter loop; the detector results are built here as plain
+        # dicts, so an exact type check is enough
+        high_confidence = 0
+        for p in patterns.values():
+            if type(p) is dict and p.get('confidence') == 'high':
+                high_confidence += 1
         
         if total_patterns == 0:
             strength = 'none'
@@ -1531,8 +1676,9 @@ class PatternRecognitionService:
                 'note': 'Make sure you have logged periods to create cycles. Use /log-period endpoint to create cycles.'
             }
         
-        # Reverse to chronological order
-        cycles = list(reversed(cycles))
+        # Reverse to chronological order, in place (the list is walked several
+        # times below, so a one-shot reversed() iterator would not do)
+        cycles.reverse()
         
         # Detect field type
         field_type, _ = FieldTypeDetector.detect_field_type(
@@ -1541,77 +1687,99 @@ class PatternRecognitionService:
         
         settings = PeriodCycleService.get_tracker_settings(tracker_id)
         
-        # Extract symptom data for each cycle with timing context
-        cycle_data = []
-        
-        for cycle in cycles:
-            entries = TrackingData.query.filter_by(
-                tracker_id=tracker_id
-            ).filter(
-                TrackingData.entry_date >= cycle.cycle_start_date,
-                TrackingData.entry_date <= (cycle.cycle_end_date or cycle.predicted_next_period_date)
-            ).order_by(TrackingData.entry_date.asc()).all()
-            
-            # Extract field values with cycle context
-            extracted = AnalyticsDataExtractor.extract_field_values(
-                entries, symptom_field, option, tracker_id
-            )
-            
-            if not extracted:
-                continue
-            
-            # Annotate each entry with cycle timing
-            annotated_entries = []
-            for item in extracted:
-                if item['value'] is None:
-                    continue
-                
-                days_since_start = (item['entry_date'] - cycle.cycle_start_date).days + 1
-                
-                # Determine phase
-                if days_since_start <= settings['average_period_length']:
-                    phase = 'menstruation'
-                    phase_day = days_since_start  # Day 1, 2, 3 of period
-                elif days_since_start <= (settings['average_cycle_length'] // 2) - 2:
-                    phase = 'follicular'
-                    phase_day = days_since_start - settings['average_period_length']
-                elif days_since_start <= (settings['average_cycle_length'] // 2) + 2:
-                    phase = 'ovulation'
-                    phase_day = days_since_start - ((settings['average_cycle_length'] // 2) - 2)
-                else:
-                    phase = 'luteal'
-                    phase_day = days_since_start - ((settings['average_cycle_length'] // 2) + 2)
-                
-                # Days relative to period end (for "when period ends" patterns)
-                if cycle.period_end_date:
-                    days_after_period_end = (item['entry_date'] - cycle.period_end_date).days
-                else:
-                    estimated_end = cycle.period_start_date + timedelta(days=settings['average_period_length'])
-                    days_after_period_end = (item['entry_date'] - estimated_end).days
-                
-                annotated_entries.append({
-                    'value': item['value'],
-                    'cycle_day': days_since_start,
-                    'phase': phase,
-                    'phase_day': phase_day,
-                    'days_after_period_end': days_after_period_end,
-                    'date': item['entry_date']
-                })
-            
-            if annotated_entries:
-                cycle_data.append({
-                    'cycle_id': cycle.id,
-                    'cycle_number': len(cycle_data) + 1,
-                    'entries': annotated_entries
-                })
+        # Fetch and extract the whole span of the analysed cycles in one range
+        # query, streamed with only the columns extraction reads; each cycle
+        # then takes its date slice of the sorted results
+        cycle_ends = [cycle.cycle_end_date or cycle.predicted_next_period_date for cycle in cycles]
+        entries = TrackingData.query.filter_by(
+            tracker_id=tracker_id
+        ).filter(
+            TrackingData.entry_date >= min(cycle.cycle_start_date for cycle in cycles),
+            TrackingData.entry_date <= max(cycle_ends)
+        ).options(
+            load_only(TrackingData.entry_date, TrackingData.data)
+        ).order_by(TrackingData.entry_date.asc()).yield_per(1000)
+        
+        all_extracted = AnalyticsDataExtractor.extract_field_values(
+            entries, symptom_field, option, tracker_id
+        )
+        extracted_dates = np.array(
+            [item['entry_date'] for item in all_extracted], dtype='datetime64[D]'
+        )
+        # Numeric values stay float64: the reported means and their 30%
+        # thresholds are float64 results, and float32 scalars neither round the
+        # same nor serialize as JSON numbers
+        extracted_values = np.fromiter(
+            (item['value'] for item in all_extracted),
+            dtype=np.float64 if field_type == 'numeric' else object,
+            count=len(all_extracted)
+        )
+        
+        # Phase of a cycle day: the first phase whose last day (phase_bounds)
+        # it does not pass, with phase_day counted from the previous boundary
+        # (phase_offsets). The running max keeps the bounds sorted for
+        # np.digitize; a period longer than the follicular boundary simply
+        # leaves the follicular phase empty.
+        half_cycle = settings['average_cycle_length'] // 2
+        phase_offsets = np.array([
+            0, settings['average_period_length'], half_cycle - 2, half_cycle + 2
+        ])
+        phase_bounds = np.maximum.accumulate(phase_offsets[1:])
+        
+        # Cycle boundaries as datetime64 columns, converted once for all cycles;
+        # period ends fall back to the estimate from the average period length
+        # (for "when period ends" patterns)
+        cycle_starts = np.array([cycle.cycle_start_date for cycle in cycles], dtype='datetime64[D]')
+        period_ends = np.array([
+            cycle.period_end_date
+            or cycle.period_start_date + timedelta(days=settings['average_period_length'])
+            for cycle in cycles
+        ], dtype='datetime64[D]')
+        
+        # Each cycle's slice of the extracted entries, found for all cycles in
+        # one searchsorted call per side
+        firsts = np.searchsorted(extracted_dates, cycle_starts, side='left')
+        lasts = np.searchsorted(
+            extracted_dates, np.array(cycle_ends, dtype='datetime64[D]'), side='right'
+        )
         
-        if len(cycle_data) < min_cycles:
+        # Cycles without entries contribute nothing; when too few cycles have
+        # data, answer before annotating any of them
+        with_data = np.flatnonzero(lasts > firsts)
+        if len(with_data) < min_cycles:
             return {
                 'message': f'Need at least {min_cycles} cycles with data for {symptom_field}',
-                'cycles_with_data': len(cycle_data),
+                'cycles_with_data': len(with_data),
                 'total_cycles_checked': len(cycles)
             }
         
+        # Extract symptom data for each cycle with timing context
+        cycle_data: List[CycleColumns] = []
+        
+        for index, first, last in zip(
+            with_data.tolist(), firsts[with_data].tolist(), lasts[with_data].tolist()
+        ):
+            cycle_start = cycle_starts[index]
+            period_end = period_ends[index]
+            
+            # Annotate every entry of the cycle with its timing at once, in
+            # whole days
+            dates = extracted_dates[first:last]
+            days_since_start = (dates - cycle_start).astype(np.intp) + 1
+            phase_ids = np.digitize(days_since_start, phase_bounds, right=True)
+            phase_days = days_since_start - phase_offsets[phase_ids]
+            days_after_period_end = (dates - period_end).astype(np.intp)
+            
+            cycle_data.append(CycleColumns(
+                cycle_id=cycles[index].id,
+                values=extracted_values[first:last],
+                dates=dates,
+                cycle_days=days_since_start,
+                phase_ids=phase_ids,
+                phase_days=phase_days,
+                days_after_period_end=days_after_period_end
+            ))
+        
         # Detect recurring patterns
         if field_type == 'numeric':
             patterns = PatternRecognitionService._detect_numeric_recurring_patterns(
@@ -1631,227 +1799,265 @@ class PatternRecognitionService:
             'pattern_count': len(patterns) if patterns else 0
         }
     
+    @staticmethod
+    def _flatten_cycle_entries(
+        cycle_data: List[CycleColumns]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Annotated entries of all cycles as parallel arrays, cycle by cycle in
+        entry order: (cycle days, phase ids into _PHASE_NAMES, days after
+        period end, values).
+        """
+        return (
+            np.concatenate([cycle.cycle_days for cycle in cycle_data]),
+            np.concatenate([cycle.phase_ids for cycle in cycle_data]),
+            np.concatenate([cycle.days_after_period_end for cycle in cycle_data]),
+            np.concatenate([cycle.values for cycle in cycle_data])
+        )
+    
+    @staticmethod
+    def _grouped_means(
+        group_ids: np.ndarray,
+        values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-group counts and means for non-negative integer group ids.
+        
+        Returns the ids present in order of first appearance (the order the
+        per-group dicts used to iterate in) and count/mean arrays indexed by id,
+        histogrammed with np.bincount rather than kept as per-group lists.
+        """
+        counts = np.bincount(group_ids)
+        sums = np.bincount(group_ids, weights=values)
+        
+        present, first_index = np.unique(group_ids, return_index=True)
+        order = present[np.argsort(first_index)]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / counts
+        return order, counts, means
+    
+    @staticmethod
+    def _grouped_modes(
+        group_ids: np.ndarray,
+        codes: np.ndarray,
+        n_codes: int
+    ) -> Tuple[List[int], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Most common value code per group from one dense (group x value) count matrix.
+        
+        Returns the ids present in order of first appearance, and per-group
+        totals, mode codes and mode counts indexed by id. Ties go to the value
+        seen first within the group, as max() over an insertion-ordered count
+        dict does.
+        """
+        n_groups = int(group_ids.max()) + 1 if len(group_ids) else 0
+        counts = np.zeros((n_groups, n_codes), dtype=np.intp)
+        np.add.at(counts, (group_ids, codes), 1)
+        first_seen = np.full((n_groups, n_codes), len(codes))
+        np.minimum.at(first_seen, (group_ids, codes), np.arange(len(codes)))
+        
+        is_top = counts == counts.max(axis=1, keepdims=True, initial=0)
+        mode_codes = np.where(is_top, first_seen, len(codes)).argmin(axis=1)
+        mode_counts = counts[np.arange(n_groups), mode_codes]
+        
+        present, first_index = np.unique(group_ids, return_index=True)
+        order = present[np.argsort(first_index)].tolist()
+        return order, counts.sum(axis=1), mode_codes, mode_counts
+    
     @staticmethod
     def _detect_numeric_recurring_patterns(
-        cycle_data: List[Dict],
+        cycle_data: List[CycleColumns],
         symptom_field: str,
         min_cycles: int
     ) -> List[Dict[str, Any]]:
         """Detect recurring numeric patterns (e.g., spikes, drops at specific times)."""
         patterns = []
+        cycle_days, phase_ids, days_after_end, values = (
+            PatternRecognitionService._flatten_cycle_entries(cycle_data)
+        )
+        
+        # Display names for the insights, resolved once rather than per
+        # formatted pattern (early cycle days read as the period variant)
+        display_name = PatternRecognitionService._get_field_display_name(symptom_field)
+        menstruation_name = PatternRecognitionService._get_field_display_name(symptom_field, 'menstruation')
         
         # 1. Check for spikes/drops at specific cycle days
         # Group by cycle day across all cycles
-        cycle_day_values = defaultdict(list)
-        for cycle in cycle_data:
-            for entry in cycle['entries']:
-                cycle_day_values[entry['cycle_day']].append({
-                    'value': entry['value'],
-                    'cycle_number': cycle['cycle_number']
-                })
-        
-        # Calculate average for each day
-        overall_mean = np.mean([
-            entry['value'] 
-            for cycle in cycle_data 
-            for entry in cycle['entries']
-        ])
-        
-        # Find days with consistently high/low values
-        for cycle_day, values_list in cycle_day_values.items():
-            if len(values_list) < min_cycles:
-                continue
+        day_order, day_counts, day_means = PatternRecognitionService._grouped_means(cycle_days, values)
+        
+        # Overall average, from the values already flattened above
+        overall_mean = values.mean()
+        
+        # Find days with consistently high/low values: significantly different
+        # from the overall mean (30% higher or lower), flagged for all days at
+        # once so only those days are visited
+        with np.errstate(invalid='ignore'):
+            enough_cycles = day_counts >= min_cycles
+            spike_days = enough_cycles & (day_means > overall_mean * 1.3)
+            drop_days = enough_cycles & (day_means < overall_mean * 0.7)
+        
+        for cycle_day in day_order[(spike_days | drop_days)[day_order]].tolist():
+            count = int(day_counts[cycle_day])
+            day_mean = day_means[cycle_day]
             
-            values = [v['value'] for v in values_list]
-            day_mean = np.mean(values)
-            
-            # Check if significantly different from overall mean
-            if day_mean > overall_mean * 1.3:  # 30% higher
-                occurrence_rate = len(values) / len(cycle_data)
+            if spike_days[cycle_day]:
+                occurrence_rate = count / len(cycle_data)
                 patterns.append({
                     'type': 'spike',
                     'timing': f"Day {cycle_day} of cycle",
                     'average_value': round(day_mean, 2),
                     'overall_average': round(overall_mean, 2),
                     'difference': round(day_mean - overall_mean, 2),
-                    'occurrences': f"{len(values)}/{len(cycle_data)} cycles",
+                    'occurrences': f"{count}/{len(cycle_data)} cycles",
                     'consistency': round(occurrence_rate * 100, 1),
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, 'menstruation' if cycle_day <= 5 else None)} consistently spikes on day {cycle_day} of your cycle ({round(day_mean, 1)} vs usual {round(overall_mean, 1)})"
+                    'insight': f"Your {menstruation_name if cycle_day <= 5 else display_name} consistently spikes on day {cycle_day} of your cycle ({round(day_mean, 1)} vs usual {round(overall_mean, 1)})"
                 })
             
-            elif day_mean < overall_mean * 0.7:  # 30% lower
-                occurrence_rate = len(values) / len(cycle_data)
+            else:
+                occurrence_rate = count / len(cycle_data)
                 patterns.append({
                     'type': 'drop',
                     'timing': f"Day {cycle_day} of cycle",
                     'average_value': round(day_mean, 2),
                     'overall_average': round(overall_mean, 2),
                     'difference': round(overall_mean - day_mean, 2),
-                    'occurrences': f"{len(values)}/{len(cycle_data)} cycles",
+                    'occurrences': f"{count}/{len(cycle_data)} cycles",
                     'consistency': round(occurrence_rate * 100, 1),
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, 'menstruation' if cycle_day <= 5 else None)} consistently drops on day {cycle_day} of your cycle ({round(day_mean, 1)} vs usual {round(overall_mean, 1)})"
+                    'insight': f"Your {menstruation_name if cycle_day <= 5 else display_name} consistently drops on day {cycle_day} of your cycle ({round(day_mean, 1)} vs usual {round(overall_mean, 1)})"
                 })
         
         # 2. Check for patterns relative to period end
-        period_end_values = defaultdict(list)
-        for cycle in cycle_data:
-            for entry in cycle['entries']:
-                if entry['days_after_period_end'] >= 0:  # Only after period ends
-                    period_end_values[entry['days_after_period_end']].append({
-                        'value': entry['value'],
-                        'cycle_number': cycle['cycle_number']
-                    })
+        after_end = days_after_end >= 0  # Only after period ends
+        after_order, after_counts, after_means = PatternRecognitionService._grouped_means(
+            days_after_end[after_end], values[after_end]
+        )
         
-        for days_after, values_list in period_end_values.items():
-            if len(values_list) < min_cycles or days_after > 7:  # Only check first week after
-                continue
-            
-            values = [v['value'] for v in values_list]
-            day_mean = np.mean(values)
+        # Only check first week after
+        with np.errstate(invalid='ignore'):
+            spike_after = (
+                (after_counts >= min_cycles)
+                & (np.arange(len(after_counts)) <= 7)
+                & (after_means > overall_mean * 1.3)
+            )
+        
+        for days_after in after_order[spike_after[after_order]].tolist():
+            count = int(after_counts[days_after])
+            day_mean = after_means[days_after]
             
-            if day_mean > overall_mean * 1.3:
-                occurrence_rate = len(values) / len(cycle_data)
-                patterns.append({
-                    'type': 'spike_after_period',
-                    'timing': f"{days_after} days after period ends",
-                    'average_value': round(day_mean, 2),
-                    'occurrences': f"{len(values)}/{len(cycle_data)} cycles",
-                    'consistency': round(occurrence_rate * 100, 1),
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field)} tends to spike {days_after} days after your period ends"
-                })
+            occurrence_rate = count / len(cycle_data)
+            patterns.append({
+                'type': 'spike_after_period',
+                'timing': f"{days_after} days after period ends",
+                'average_value': round(day_mean, 2),
+                'occurrences': f"{count}/{len(cycle_data)} cycles",
+                'consistency': round(occurrence_rate * 100, 1),
+                'insight': f"Your {display_name} tends to spike {days_after} days after your period ends"
+            })
         
         # 3. Check for phase-specific patterns
-        phase_values = defaultdict(list)
-        for cycle in cycle_data:
-            for entry in cycle['entries']:
-                phase_values[entry['phase']].append(entry['value'])
+        phase_order, phase_counts, phase_mean_values = PatternRecognitionService._grouped_means(
+            phase_ids, values
+        )
         
-        phase_means = {phase: np.mean(values) for phase, values in phase_values.items() if len(values) >= min_cycles}
+        # Phases with enough values, in order of first appearance; argmax/argmin
+        # return the first extreme, so ties resolve as before
+        eligible = phase_order[phase_counts[phase_order] >= min_cycles]
         
-        if len(phase_means) >= 2:
-            highest_phase = max(phase_means, key=phase_means.get)
-            lowest_phase = min(phase_means, key=phase_means.get)
+        if len(eligible) >= 2:
+            eligible_means = phase_mean_values[eligible]
+            highest_mean = eligible_means.max()
+            highest_phase = _PHASE_NAMES[eligible[int(eligible_means.argmax())]]
             
-            if phase_means[highest_phase] > phase_means[lowest_phase] * 1.3:
-                phase_labels = {
-                    'menstruation': 'during your period',
-                    'follicular': 'in follicular phase',
-                    'ovulation': 'during ovulation',
-                    'luteal': 'in luteal phase'
-                }
-                
+            if highest_mean > eligible_means.min() * 1.3:
                 patterns.append({
                     'type': 'phase_pattern',
-                    'timing': phase_labels[highest_phase],
-                    'average_value': round(phase_means[highest_phase], 2),
+                    'timing': _PHASE_TIMINGS[highest_phase],
+                    'average_value': round(highest_mean, 2),
                     'occurrences': f"Detected across all {len(cycle_data)} cycles",
                     'consistency': 100.0,
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, highest_phase)} is consistently higher {phase_labels[highest_phase]} compared to other phases"
+                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, highest_phase)} is consistently higher {_PHASE_TIMINGS[highest_phase]} compared to other phases"
                 })
         
         return patterns
     
     @staticmethod
     def _detect_categorical_recurring_patterns(
-        cycle_data: List[Dict],
+        cycle_data: List[CycleColumns],
         symptom_field: str,
         min_cycles: int
     ) -> List[Dict[str, Any]]:
         """Detect recurring categorical patterns (e.g., specific symptoms at specific times)."""
         patterns = []
+        cycle_days, phase_ids, days_after_end, values = (
+            PatternRecognitionService._flatten_cycle_entries(cycle_data)
+        )
         
-        # 1. Check for specific values at specific cycle days
-        cycle_day_values = defaultdict(lambda: defaultdict(int))
-        for cycle in cycle_data:
-            for entry in cycle['entries']:
-                cycle_day_values[entry['cycle_day']][entry['value']] += 1
+        # Display names for the insights, resolved once rather than per
+        # formatted pattern (early cycle days read as the period variant)
+        display_name = PatternRecognitionService._get_field_display_name(symptom_field)
+        menstruation_name = PatternRecognitionService._get_field_display_name(symptom_field, 'menstruation')
+        
+        # Factorize values once (codes in order of first appearance) so every
+        # grouping below is a dense count matrix instead of nested dicts
+        code_of: Dict[Any, int] = {}
+        codes = np.fromiter(
+            (code_of.setdefault(value, len(code_of)) for value in values.tolist()),
+            dtype=np.intp, count=len(values)
+        )
+        labels = list(code_of)
         
-        for cycle_day, value_counts in cycle_day_values.items():
-            total_at_day = sum(value_counts.values())
-            
-            if total_at_day < min_cycles:
-                continue
-            
-            # Find most common value at this day
-            most_common = max(value_counts, key=value_counts.get)
-            occurrence_count = value_counts[most_common]
-            consistency = occurrence_count / total_at_day
-            
-            if consistency >= 0.6 and occurrence_count >= min_cycles:  # 60% consistency
-                patterns.append({
-                    'type': 'cycle_day_pattern',
-                    'timing': f"Day {cycle_day} of cycle",
-                    'value': most_common,
-                    'occurrences': f"{occurrence_count}/{len(cycle_data)} cycles",
-                    'consistency': round(consistency * 100, 1),
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, 'menstruation' if cycle_day <= 5 else None)} is typically '{most_common}' on day {cycle_day} of your cycle (found in {occurrence_count}/{len(cycle_data)} cycles)"
-                })
+        def select(group_ids: np.ndarray, group_codes: np.ndarray, min_consistency: float, per_cycle: bool):
+            """(group, most common value, its count, consistency) for the groups passing the thresholds."""
+            order, totals, mode_codes, mode_counts = PatternRecognitionService._grouped_modes(
+                group_ids, group_codes, len(labels)
+            )
+            with np.errstate(divide='ignore', invalid='ignore'):
+                consistency = mode_counts / (len(cycle_data) if per_cycle else totals)
+            passing = (totals >= min_cycles) & (consistency >= min_consistency) & (mode_counts >= min_cycles)
+            return [
+                (group, labels[mode_codes[group]], int(mode_counts[group]), float(consistency[group]))
+                for group in order
+                if passing[group]
+            ]
         
-        # 2. Patterns relative to period end (e.g., "creamy when period ends")
-        period_end_values = defaultdict(lambda: defaultdict(int))
-        for cycle in cycle_data:
-            for entry in cycle['entries']:
-                if 0 <= entry['days_after_period_end'] <= 3:  # First 3 days after period
-                    period_end_values[entry['days_after_period_end']][entry['value']] += 1
-        
-        for days_after, value_counts in period_end_values.items():
-            total = sum(value_counts.values())
-            
-            if total < min_cycles:
-                continue
-            
-            most_common = max(value_counts, key=value_counts.get)
-            occurrence_count = value_counts[most_common]
-            consistency = occurrence_count / total
-            
-            if consistency >= 0.6 and occurrence_count >= min_cycles:
-                timing_labels = {
-                    0: "right when period ends",
-                    1: "1 day after period ends",
-                    2: "2 days after period ends",
-                    3: "3 days after period ends"
-                }
-                
-                patterns.append({
-                    'type': 'period_end_pattern',
-                    'timing': timing_labels.get(days_after, f"{days_after} days after period"),
-                    'value': most_common,
-                    'occurrences': f"{occurrence_count}/{len(cycle_data)} cycles",
-                    'consistency': round(consistency * 100, 1),
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field)} is typically '{most_common}' {timing_labels.get(days_after, f'{days_after} days after period')} (found in {occurrence_count}/{len(cycle_data)} cycles)"
-                })
+        # 1. Check for specific values at specific cycle days (60% consistency)
+        for cycle_day, most_common, occurrence_count, consistency in select(cycle_days, codes, 0.6, False):
+            patterns.append({
+                'type': 'cycle_day_pattern',
+                'timing': f"Day {cycle_day} of cycle",
+                'value': most_common,
+                'occurrences': f"{occurrence_count}/{len(cycle_data)} cycles",
+                'consistency': round(consistency * 100, 1),
+                'insight': f"Your {menstruation_name if cycle_day <= 5 else display_name} is typically '{most_common}' on day {cycle_day} of your cycle (found in {occurrence_count}/{len(cycle_data)} cycles)"
+            })
         
-        # 3. Phase-specific patterns
-        phase_values = defaultdict(lambda: defaultdict(int))
-        for cycle in cycle_data:
-            for entry in cycle['entries']:
-                phase_values[entry['phase']][entry['value']] += 1
+        # 2. Patterns relative to period end (e.g., "creamy when period ends")
+        just_after_end = (days_after_end >= 0) & (days_after_end <= 3)  # First 3 days after period
+        for days_after, most_common, occurrence_count, consistency in select(
+            days_after_end[just_after_end], codes[just_after_end], 0.6, False
+        ):
+            timing = _PERIOD_END_TIMINGS.get(days_after, f"{days_after} days after period")
+            patterns.append({
+                'type': 'period_end_pattern',
+                'timing': timing,
+                'value': most_common,
+                'occurrences': f"{occurrence_count}/{len(cycle_data)} cycles",
+                'consistency': round(consistency * 100, 1),
+                'insight': f"Your {display_name} is typically '{most_common}' {timing} (found in {occurrence_count}/{len(cycle_data)} cycles)"
+            })
         
-        for phase, value_counts in phase_values.items():
-            total = sum(value_counts.values())
-            
-            if total < min_cycles:
-                continue
-            
-            most_common = max(value_counts, key=value_counts.get)
-            occurrence_count = value_counts[most_common]
-            consistency = occurrence_count / len(cycle_data)  # Against total cycles, not just entries
-            
-            if consistency >= 0.5 and occurrence_count >= min_cycles:  # 50% of cycles
-                phase_labels = {
-                    'menstruation': 'during your period',
-                    'follicular': 'in follicular phase',
-                    'ovulation': 'during ovulation',
-                    'luteal': 'in luteal phase'
-                }
-                
-                patterns.append({
-                    'type': 'phase_pattern',
-                    'timing': phase_labels[phase],
-                    'value': most_common,
-                    'occurrences': f"{occurrence_count}/{len(cycle_data)} cycles",
-                    'consistency': round(consistency * 100, 1),
-                    'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, phase)} is typically '{most_common}' {phase_labels[phase]} (found in {occurrence_count}/{len(cycle_data)} cycles)"
-                })
+        # 3. Phase-specific patterns (consistency against total cycles, not just
+        # entries - 50% of cycles)
+        for phase_id, most_common, occurrence_count, consistency in select(phase_ids, codes, 0.5, True):
+            phase = _PHASE_NAMES[phase_id]
+            patterns.append({
+                'type': 'phase_pattern',
+                'timing': _PHASE_TIMINGS[phase],
+                'value': most_common,
+                'occurrences': f"{occurrence_count}/{len(cycle_data)} cycles",
+                'consistency': round(consistency * 100, 1),
+                'insight': f"Your {PatternRecognitionService._get_field_display_name(symptom_field, phase)} is typically '{most_common}' {_PHASE_TIMINGS[phase]} (found in {occurrence_count}/{len(cycle_data)} cycles)"
+            })
         
         return patterns
\ No newline at end of file
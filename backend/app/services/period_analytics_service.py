@@ -68,15 +68,12 @@ class PeriodAnalyticsService:
         # Sort dates in ascending order (oldest first) for correct cycle length calculation
         period_starts = sorted(period_starts)
         
-        # Calculate cycle lengths
-        cycle_lengths = []
-        for i in range(len(period_starts) - 1):
-            cycle_length = (period_starts[i+1] - period_starts[i]).days
-            cycle_lengths.append(cycle_length)
+        # Calculate cycle lengths (days between consecutive starts)
+        cycle_lengths = np.diff(np.array(period_starts, dtype='datetime64[D]')).astype(np.int64)
         
-        # Statistical analysis
-        avg_length = np.mean(cycle_lengths)
-        std_dev = np.std(cycle_lengths)
+        # Statistical analysis; std reuses the mean
+        avg_length = cycle_lengths.mean()
+        std_dev = cycle_lengths.std(mean=avg_length)
         
         # Regularity score (0-100)
         # Perfect regularity (std_dev=0) = 100
@@ -97,11 +94,11 @@ class PeriodAnalyticsService:
             'cycles_analyzed': len(cycle_lengths),
             'average_length': round(avg_length, 1),
             'std_deviation': round(std_dev, 2),
-            'shortest_cycle': min(cycle_lengths),
-            'longest_cycle': max(cycle_lengths),
+            'shortest_cycle': int(cycle_lengths.min()),
+            'longest_cycle': int(cycle_lengths.max()),
             'regularity_score': round(regularity_score, 1),
             'regularity_level': regularity_level,
-            'cycle_lengths': cycle_lengths,
+            'cycle_lengths': cycle_lengths.tolist(),
             'period_start_dates': [d.isoformat() for d in period_starts],
             'medical_note': PeriodAnalyticsService.generate_medical_note(
                 avg_length, std_dev
@@ -340,16 +337,19 @@ class PeriodAnalyticsService:
             date.fromisoformat(calendar_grid['calendar_end'])
         )
         
+        # Settings are read once here and shared with the per-day annotation
+        settings = PeriodCycleService.get_tracker_settings(tracker_id)
+        
         # Annotate each day with cycle information
         annotated_days = PeriodAnalyticsService.annotate_calendar_days(
             calendar_grid['days'],
             cycles,
-            include_predictions
+            include_predictions,
+            settings
         )
         
         # Get current cycle info
         current_cycle = PeriodCycleService.get_current_cycle(tracker_id)
-        settings = PeriodCycleService.get_tracker_settings(tracker_id)
         
         return {
             'month': {
@@ -455,30 +455,38 @@ class PeriodAnalyticsService:
     def annotate_calendar_days(
         days: List[Dict],
         cycles: List[PeriodCycle],
-        include_predictions: bool
+        include_predictions: bool,
+        settings: Dict[str, Any]
     ) -> List[Dict]:
 
+        # Serialized cycle info, built once per cycle rather than per day
+        cycle_infos: Dict[int, Dict] = {}
+        
         annotated = []
         
         for day_info in days:
             day_date = date.fromisoformat(day_info['date'])
             
             # Find which cycle this day belongs to
-            cycle_info = PeriodAnalyticsService._find_cycle_for_day(
+            cycle = PeriodAnalyticsService._find_cycle_for_day(
                 day_date, cycles
             )
             
-            day_info['cycle'] = cycle_info
-            
-            if cycle_info:
+            if cycle:
+                if cycle.id not in cycle_infos:
+                    cycle_infos[cycle.id] = PeriodAnalyticsService._serialize_day_cycle(cycle)
+                day_info['cycle'] = cycle_infos[cycle.id]
+                
                 # Determine phase for this day
                 phase_info = PeriodAnalyticsService._determine_day_phase(
                     day_date,
-                    cycle_info,
-                    include_predictions
+                    cycle,
+                    include_predictions,
+                    settings
                 )
                 day_info['phase'] = phase_info
             else:
+                day_info['cycle'] = None
                 day_info['phase'] = None
             
             annotated.append(day_info)
@@ -486,35 +494,40 @@ class PeriodAnalyticsService:
         return annotated
     
     @staticmethod
-    def _find_cycle_for_day(day_date: date, cycles: List[PeriodCycle]) -> Optional[Dict]:
+    def _find_cycle_for_day(day_date: date, cycles: List[PeriodCycle]) -> Optional[PeriodCycle]:
         for cycle in cycles:
             cycle_end = cycle.cycle_end_date or cycle.predicted_next_period_date
             
             if cycle.cycle_start_date <= day_date:
                 if not cycle_end or day_date < cycle_end:
-                    return {
-                        'cycle_id': cycle.id,
-                        'cycle_start_date': cycle.cycle_start_date.isoformat(),
-                        'cycle_end_date': cycle.cycle_end_date.isoformat() if cycle.cycle_end_date else None,
-                        'period_start_date': cycle.period_start_date.isoformat(),
-                        'period_end_date': cycle.period_end_date.isoformat() if cycle.period_end_date else None,
-                        'is_current': cycle.is_current,
-                        'is_complete': cycle.is_complete
-                    }
+                    return cycle
         
         return None
     
+    @staticmethod
+    def _serialize_day_cycle(cycle: PeriodCycle) -> Dict:
+        return {
+            'cycle_id': cycle.id,
+            'cycle_start_date': cycle.cycle_start_date.isoformat(),
+            'cycle_end_date': cycle.cycle_end_date.isoformat() if cycle.cycle_end_date else None,
+            'period_start_date': cycle.period_start_date.isoformat(),
+            'period_end_date': cycle.period_end_date.isoformat() if cycle.period_end_date else None,
+            'is_current': cycle.is_current,
+            'is_complete': cycle.is_complete
+        }
+    
     @staticmethod
     def _determine_day_phase(
         day_date: date,
-        cycle_info: Dict,
-        include_predictions: bool
+        cycle: PeriodCycle,
+        include_predictions: bool,
+        settings: Dict[str, Any]
     ) -> Optional[Dict]:
         
-        # Get cycle object if needed, or use cycle_info dict
-        period_start_date = date.fromisoformat(cycle_info['period_start_date'])
-        period_end_date = date.fromisoformat(cycle_info['period_end_date']) if cycle_info['period_end_date'] else None
-        is_complete = cycle_info['is_complete']
+        # Dates straight from the cycle, no round trip through the serialized info
+        period_start_date = cycle.period_start_date
+        period_end_date = cycle.period_end_date
+        is_complete = cycle.is_complete
         
         # Period phase (confirmed)
         if period_start_date <= day_date:
@@ -528,22 +541,14 @@ class PeriodAnalyticsService:
         # If we don't have period end, estimate it
         estimated_period_end = period_end_date
         if not estimated_period_end:
-            # Need to get settings to estimate period end
-            # We'll need the cycle object for tracker_id, so let's get it from cycle_id
-            cycle = PeriodCycle.query.get(cycle_info['cycle_id'])
-            if cycle:
-                settings = PeriodCycleService.get_tracker_settings(cycle.tracker_id)
-                estimated_period_end = period_start_date + timedelta(
-                    days=settings['average_period_length'] - 1
-                )
-            else:
-                estimated_period_end = period_start_date + timedelta(days=4)  # Default 5 days
+            # Estimate from the tracker's average period length
+            estimated_period_end = period_start_date + timedelta(
+                days=settings['average_period_length'] - 1
+            )
         
         # After period ends
         if day_date > estimated_period_end:
-            # Get cycle for ovulation date
-            cycle = PeriodCycle.query.get(cycle_info['cycle_id'])
-            if cycle and cycle.predicted_ovulation_date:
+            if cycle.predicted_ovulation_date:
                 days_from_ovulation = abs((day_date - cycle.predicted_ovulation_date).days)
                 
                 if days_from_ovulation <= 1:
@@ -630,11 +635,13 @@ class PeriodAnalyticsService:
             predictions = []
             reality = []
             for cycle in cycles:
+                # One phase computation per cycle, on the cycle already loaded
+                phases = PeriodCycleService.get_phases_dates_for_cycle(tracker_id, cycle)
                 predictions.append({
-                    'predictions': PeriodCycleService.get_cycle_phases_dates(tracker_id, cycle.id)['cycle_predictions'],
+                    'predictions': phases['cycle_predictions'],
                 })
                 reality.append({
-                    'reality': PeriodCycleService.get_cycle_phases_dates(tracker_id, cycle.id)['cycle_info'],
+                    'reality': phases['cycle_info'],
                 })
             return {
                 'predictions': predictions,
@@ -692,6 +699,11 @@ class PeriodAnalyticsService:
             TrackingData.entry_date >= cutoff_date
         ).order_by(TrackingData.entry_date.asc()).all()
         
+        # Cycles loaded once; each entry's cycle is then a binary search on
+        # their start dates instead of a query per entry
+        cycles = PeriodCycleService.get_all_cycles(tracker_id)
+        cycle_starts = [cycle.cycle_start_date for cycle in cycles]
+        
         # Filter to entries that:
         # 1. Have the field (handled by shared extractor, but we pre-filter here for efficiency)
         # 2. Belong to a cycle
@@ -715,7 +727,7 @@ class PeriodAnalyticsService:
                 continue
             
             # Check if entry belongs to a cycle
-            cycle = PeriodCycleService.find_cycle_for_date(tracker_id, entry.entry_date)
+            cycle = PeriodCycleService.find_cycle_in(cycles, cycle_starts, entry.entry_date)
             if cycle:
                 entries_with_cycles.append(entry)
         
@@ -742,13 +754,15 @@ class PeriodAnalyticsService:
             Same data structure with phase annotations added
         """
         settings = PeriodCycleService.get_tracker_settings(tracker_id)
+        cycles = PeriodCycleService.get_all_cycles(tracker_id)
+        cycle_starts = [cycle.cycle_start_date for cycle in cycles]
         
         annotated = []
         for item in data:
             entry_date = item['entry_date']
             
             # Find cycle for this date
-            cycle = PeriodCycleService.find_cycle_for_date(tracker_id, entry_date)
+            cycle = PeriodCycleService.find_cycle_in(cycles, cycle_starts, entry_date)
             
             if cycle:
                 # Calculate cycle day and phase
@@ -2,6 +2,8 @@
 specialized service for cycle operations
 """
 
+from bisect import bisect_left, bisect_right
+
 from app.models.period_cycle import PeriodCycle
 from app.models.tracker import Tracker
 from app.models.tracker_category import TrackerCategory
@@ -20,8 +22,16 @@ from app.utils.menstruation_calculations import (
 class PeriodCycleService:
     @staticmethod
     def get_tracker_settings(tracker_id: int) -> Dict[str, Any]:
+        """
+        Cycle settings of a tracker, with defaults filled in.
+        
+        Not memoized on purpose: the tracker is looked up through the session's
+        identity map, so repeat calls within a request do not query again, and
+        always see settings rewritten earlier in the same request (e.g. after a
+        period is logged), which a cached dict would not.
+        """
         try:
-            tracker = Tracker.query.get(tracker_id)
+            tracker = db.session.get(Tracker, tracker_id)
             if not tracker:
                 raise ValueError("Tracker not found")
             settings = tracker.settings or {}
@@ -337,26 +347,33 @@ class PeriodCycleService:
             raise ValueError(f"Failed to recalculate all cycles: {str(e)}")
 
     @staticmethod
-    def find_cycle_for_date(tracker_id: int, target_date: date) -> Optional[PeriodCycle]:
+    def get_all_cycles(tracker_id: int) -> List[PeriodCycle]:
         try:
-            all_cycles = PeriodCycle.query.filter_by(
+            return PeriodCycle.query.filter_by(
                 tracker_id=tracker_id
             ).order_by(PeriodCycle.cycle_start_date.asc()).all()
-            
-            for cycle in all_cycles:
-                # Find next cycle after this one
-                next_start = None
-                for c in all_cycles:
-                    if c.cycle_start_date > cycle.cycle_start_date:
-                        if next_start is None or c.cycle_start_date < next_start:
-                            next_start = c.cycle_start_date
-                
-                # Check if target date falls in this cycle
-                if cycle.cycle_start_date <= target_date:
-                    if next_start is None or target_date < next_start:
-                        return cycle
-            
+        except Exception as e:
+            raise ValueError(f"Failed to get cycles: {str(e)}")
+
+    @staticmethod
+    def find_cycle_in(cycles: List[PeriodCycle], starts: List[date], target_date: date) -> Optional[PeriodCycle]:
+        """
+        Cycle containing target_date among cycles from get_all_cycles, given
+        their start dates: the latest start on or before the date (the first
+        such cycle when several share that start), found by binary search.
+        """
+        index = bisect_right(starts, target_date)
+        if index == 0:
             return None
+        return cycles[bisect_left(starts, starts[index - 1])]
+
+    @staticmethod
+    def find_cycle_for_date(tracker_id: int, target_date: date) -> Optional[PeriodCycle]:
+        try:
+            all_cycles = PeriodCycleService.get_all_cycles(tracker_id)
+            return PeriodCycleService.find_cycle_in(
+                all_cycles, [cycle.cycle_start_date for cycle in all_cycles], target_date
+            )
         except Exception as e:
             raise ValueError(f"Failed to find cycle for date: {str(e)}")
 
@@ -424,7 +441,15 @@ class PeriodCycleService:
             cycle = PeriodCycle.query.filter_by(tracker_id=tracker_id, id=cycle_id).first()
             if not cycle:
                 raise ValueError("Cycle not found")
-            
+        except Exception as e:
+            raise ValueError(f"Failed to get cycle phases dates: {str(e)}")
+        
+        return PeriodCycleService.get_phases_dates_for_cycle(tracker_id, cycle)
+    
+    @staticmethod
+    def get_phases_dates_for_cycle(tracker_id: int, cycle: PeriodCycle) -> Dict[str, Any]:
+        """get_cycle_phases_dates for a cycle that is already loaded."""
+        try:
             # Get cycle boundaries with fallbacks
             cycle_start = cycle.cycle_start_date
             cycle_end = cycle.cycle_end_date or cycle.predicted_next_period_date
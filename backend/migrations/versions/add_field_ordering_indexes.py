@@ -0,0 +1,44 @@
+"""Add composite indexes for field and option ordering lookups
+
+Revision ID: add_field_ordering_indexes
+Revises: cascade_user_tracker_deletes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = 'add_field_ordering_indexes'
+down_revision = 'cascade_user_tracker_deletes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'idx_tracker_fields_category_group_order',
+        'tracker_fields',
+        ['category_id', 'field_group', 'is_active', 'field_order'],
+    )
+    op.create_index(
+        'idx_tracker_user_fields_tracker_order',
+        'tracker_user_fields',
+        ['tracker_id', 'is_active', 'field_order'],
+    )
+    op.create_index(
+        'idx_field_options_user_field_order',
+        'field_options',
+        ['tracker_user_field_id', 'is_active', 'option_order'],
+    )
+    op.create_index(
+        'idx_field_options_field_order',
+        'field_options',
+        ['tracker_field_id', 'is_active', 'option_order'],
+    )
+
+
+def downgrade():
+    op.drop_index('idx_field_options_field_order', table_name='field_options')
+    op.drop_index('idx_field_options_user_field_order', table_name='field_options')
+    op.drop_index('idx_tracker_user_fields_tracker_order', table_name='tracker_user_fields')
+    op.drop_index('idx_tracker_fields_category_group_order', table_name='tracker_fields')